@@ -1,5 +1,9 @@
 """Entry point for PyInstaller .exe builds."""
+import multiprocessing
+
 from blackboxaf.app import main
 
 if __name__ == "__main__":
+    # Required for the scanner's worker processes in a frozen .exe
+    multiprocessing.freeze_support()
     main()
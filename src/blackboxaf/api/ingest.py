@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException
@@ -65,6 +66,7 @@ async def ingest_project(request: IngestRequest):
             project_path,
             progress_callback=on_progress,
             custom_brand_terms=request.brand_terms,
+            workers=os.cpu_count() or 1,
         ),
     )
 
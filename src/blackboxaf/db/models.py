@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import json
 from datetime import datetime, timezone
+from functools import lru_cache
 
 from sqlalchemy import (
     Boolean,
@@ -78,6 +79,8 @@ class Pattern(Base):
         Index("idx_pattern_category_type", "category", "pattern_type"),
         Index("idx_pattern_source", "source_hash"),
         Index("idx_pattern_complexity", "complexity_score"),
+        # Case-insensitive object lookups (source_object COLLATE NOCASE = ?)
+        Index("idx_pattern_object_nocase", source_object.collate("NOCASE")),
     )
 
     @staticmethod
@@ -113,14 +116,19 @@ class Pattern(Base):
         self.field_references = json.dumps(refs)
 
     def get_field_references(self) -> list[str]:
-        return json.loads(self.field_references or "[]")
+        return list(_decode_list(self.field_references or "[]"))
 
     def set_tags(self, tag_list: list[str]):
         self.tags = json.dumps(tag_list)
 
     def get_tags(self) -> list[str]:
+        return self.parse_tags(self.tags)
+
+    @staticmethod
+    def parse_tags(raw: str | None) -> list[str]:
+        """Decode a stored tags column, for rows selected without the ORM."""
         try:
-            return json.loads(self.tags or "[]")
+            return list(_decode_list(raw or "[]"))
         except json.JSONDecodeError:
             return []
 
@@ -161,3 +169,9 @@ class Pattern(Base):
             "use_count": self.use_count,
             "seen_in_sources": self.get_seen_in_sources(),
         }
+
+
+@lru_cache(maxsize=4096)
+def _decode_list(raw: str) -> tuple:
+    """Decode a JSON array column, memoized since many rows share a value."""
+    return tuple(json.loads(raw))
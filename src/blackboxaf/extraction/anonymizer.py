@@ -14,7 +14,8 @@ never WHO it was built for.
 from __future__ import annotations
 
 import re
-from typing import Any
+from functools import partial
+from typing import Any, Callable
 
 # ── Salesforce Record ID Detection ──
 
@@ -271,20 +272,28 @@ class BrandScrubber:
 
     def scrub(self, text: str) -> str:
         """Replace all known brand terms in text with generic labels."""
-        if not text or not self._brand_map:
-            return text
-        if self._pattern is None:
+        if not text or self._pattern is None:
             return text
+        return self._pattern.sub(self._replace_term, text)
 
-        def _replace(match: re.Match) -> str:
-            term = match.group(0)
-            # Try exact match first, then case variations
-            return (self._brand_map.get(term)
-                    or self._brand_map.get(term.lower())
-                    or self._brand_map.get(term.capitalize())
-                    or f"[BRAND]")
+    def substituter(self) -> Callable[[str], str] | None:
+        """Return scrub() specialized to the current terms, or None if there are none.
 
-        return self._pattern.sub(_replace, text)
+        The result calls the compiled pattern's sub() directly, with no
+        Python frame per string; rebuild it after adding terms.
+        """
+        if self._pattern is None:
+            return None
+        return partial(self._pattern.sub, self._replace_term)
+
+    def _replace_term(self, match: re.Match) -> str:
+        """Label for one matched term: exact match first, then case variations."""
+        term = match.group(0)
+        brand_map = self._brand_map
+        return (brand_map.get(term)
+                or brand_map.get(term.lower())
+                or brand_map.get(term.capitalize())
+                or "[BRAND]")
 
     def _rebuild_pattern(self) -> None:
         """Rebuild the regex pattern from current brand map.
@@ -490,6 +499,12 @@ def get_scrubber() -> BrandScrubber | None:
     return _active_scrubber
 
 
+def set_scrubber(scrubber: BrandScrubber | None) -> None:
+    """Install an already-configured scrubber (e.g. in a worker process)."""
+    global _active_scrubber
+    _active_scrubber = scrubber
+
+
 # ── Core anonymization functions ──
 
 def _looks_like_sf_id(value: str) -> bool:
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import hashlib
+import sys
 import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -19,6 +21,24 @@ def sf_tag(tag: str) -> str:
     return f"{{{SF_NS}}}{tag}"
 
 
+@lru_cache(maxsize=256)
+def source_hash_for(source_id: str) -> str:
+    """Return the short anonymous hash identifying a source project."""
+    return hashlib.sha256(source_id.encode()).hexdigest()[:12]
+
+
+@lru_cache(maxsize=256)
+def qualified_tag(ns: str, tag: str) -> str:
+    """Return the Clark name ``{ns}tag``, memoized per namespace and tag."""
+    return f"{{{ns}}}{tag}"
+
+
+def root_namespace(root: ET.Element) -> str | None:
+    """Return the namespace URI of a root element, or None if unqualified."""
+    tag = root.tag
+    return tag[1:tag.index("}")] if "}" in tag else None
+
+
 def find_text(element: ET.Element, tag: str, default: str = "") -> str:
     """Find text content of a child element, namespace-aware."""
     child = element.find(sf_tag(tag))
@@ -30,6 +50,30 @@ def find_all(element: ET.Element, tag: str) -> list[ET.Element]:
     return element.findall(sf_tag(tag))
 
 
+def sf_tags(*tags: str) -> dict[str, str]:
+    """Map fully-qualified Salesforce tags back to their local names."""
+    return {sf_tag(tag): tag for tag in tags}
+
+
+def child_texts(element: ET.Element, tags: dict[str, str]) -> dict[str, str]:
+    """Collect the text of several children in a single pass.
+
+    ``tags`` comes from sf_tags(). Like find_text(), only the first child
+    with a given tag counts; children without text are left out so callers
+    can use ``.get(name, default)``.
+    """
+    found: dict[str, str] = {}
+    seen: set[str] = set()
+    for child in element:
+        name = tags.get(child.tag)
+        if name is None or name in seen:
+            continue
+        seen.add(name)
+        if child.text:
+            found[name] = child.text.strip()
+    return found
+
+
 def element_to_dict(element: ET.Element) -> dict[str, Any]:
     """Recursively convert an XML element to a dict, stripping namespaces."""
     tag = element.tag.split("}")[-1] if "}" in element.tag else element.tag
@@ -107,7 +151,7 @@ class BaseExtractor(ABC):
     """Abstract base for all metadata type extractors."""
 
     def __init__(self, source_id: str) -> None:
-        self.source_hash = hashlib.sha256(source_id.encode()).hexdigest()[:12]
+        self.source_hash = source_hash_for(source_id)
 
     @abstractmethod
     def extract(self, file_path: Path) -> list[ExtractedPattern]:
@@ -206,16 +250,40 @@ class BaseExtractor(ABC):
 
     def _auto_tags(self, pattern: ExtractedPattern) -> list[str]:
         """Generate automatic tags for a pattern."""
-        tags = [
+        return list(_base_tags(
             pattern.pattern_type,
-            pattern.category.lower().replace(" ", "-"),
-        ]
-        if pattern.source_object and pattern.source_object != "Unknown":
-            tags.append(pattern.source_object.lower())
-        if pattern.api_version:
-            tags.append(f"api-v{pattern.api_version}")
-        if pattern.complexity_score >= 4:
-            tags.append("complex")
-        if pattern.complexity_score <= 1:
-            tags.append("simple")
-        return tags
+            pattern.category,
+            pattern.source_object,
+            pattern.api_version,
+            pattern.complexity_score,
+        ))
+
+
+@lru_cache(maxsize=4096)
+def _base_tags(
+    pattern_type: str,
+    category: str,
+    source_object: str,
+    api_version: str,
+    complexity_score: int,
+) -> tuple[str, ...]:
+    """Automatic tags for a pattern, memoized on the fields they derive from."""
+    tags = [
+        pattern_type,
+        category.lower().replace(" ", "-"),
+    ]
+    if source_object and source_object != "Unknown":
+        tags.append(source_object.lower())
+    if api_version:
+        tags.append(f"api-v{api_version}")
+    if complexity_score >= 4:
+        tags.append("complex")
+    if complexity_score <= 1:
+        tags.append("simple")
+    return tuple(tags)
+
+
+@lru_cache(maxsize=4096)
+def prefixed_tag(prefix: str, value: str) -> str:
+    """Return the ``prefix:value`` tag as one interned string per distinct tag."""
+    return sys.intern(f"{prefix}:{value}")
@@ -0,0 +1,140 @@
+"""Structural scan of Apex source text.
+
+Kept free of extractor state and fully annotated so the module can be
+compiled with mypyc (``mypyc src/blackboxaf/extraction/parsers/_apex_core.py``)
+for large corpora. The pure-Python module is used when no compiled
+build is present.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from typing import Any
+
+_ANNOTATION_RE = re.compile(r"@(\w+)(?:\([^)]*\))?")
+
+_CLASS_RE = re.compile(
+    r"(public|private|global)\s+"
+    r"(?:(virtual|abstract|with sharing|without sharing|inherited sharing)\s+)*"
+    r"class\s+\w+\s*"
+    r"(?:extends\s+(\w+))?\s*"
+    r"(?:implements\s+([\w\s,]+))?\s*\{"
+)
+
+# Written to stay linear on adversarial input:
+# - the return type is matched atomically, emulated with the
+#   (?=(?P<x>...))(?P=x) idiom because `re` only has (?>...) from 3.11
+# - the parameter list stops at any parenthesis, so an unclosed "(" can't
+#   make every later signature rescan to the end of the file
+_METHOD_RE = re.compile(
+    r"(public|private|global|protected)\s+"
+    r"(?:static\s+)?"
+    r"(?=(?P<ret>\w+(?:<[\w,\s]+>)?))(?P=ret)\s+"
+    r"(\w+)\s*\(([^()]*)\)"
+)
+
+_SOQL_RE = re.compile(r"\[SELECT\s+(.+?)\s+FROM\s+(\w+)", re.IGNORECASE)
+
+# DML keywords, each paired with its boundary-checked regex. The cheap
+# substring test on lowercased content gates the regex scan.
+_DML_OPS: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (op, re.compile(rf"\b{op}\s+\w+", re.IGNORECASE))
+    for op in ("insert", "update", "upsert", "delete", "undelete", "merge")
+)
+
+
+def analyze_apex(content: str, class_name: str) -> dict[str, Any]:
+    """Scan Apex source for annotations, class shape, methods, SOQL and DML."""
+    access_modifier = "public"
+    annotations: list[str] = []
+    interfaces: list[str] = []
+    extends = ""
+    methods: list[dict[str, Any]] = []
+    soql_patterns: list[dict[str, str]] = []
+    dml_operations: list[str] = []
+    objects_referenced: list[str] = []
+    is_test = False
+    is_batch = False
+    is_schedulable = False
+    is_trigger_handler = False
+    is_aura_enabled = False
+    is_rest_resource = False
+
+    # Class-level annotations
+    for match in _ANNOTATION_RE.finditer(content):
+        ann: str = match.group(1)
+        if ann not in annotations:
+            annotations.append(ann)
+        if ann == "isTest" or ann == "IsTest":
+            is_test = True
+        if ann == "AuraEnabled":
+            is_aura_enabled = True
+        if ann == "RestResource":
+            is_rest_resource = True
+
+    content_lower = content.lower()
+
+    # Test class detection
+    if "@isTest" in content_lower or "testmethod" in content_lower:
+        is_test = True
+
+    # Class declaration
+    class_match = _CLASS_RE.search(content)
+    if class_match:
+        access_modifier = sys.intern(class_match.group(1))
+        if class_match.group(3):
+            extends = class_match.group(3)
+        implements: str | None = class_match.group(4)
+        if implements:
+            interfaces = [i.strip() for i in implements.split(",")]
+            if "Database.Batchable" in implements:
+                is_batch = True
+            if "Schedulable" in implements:
+                is_schedulable = True
+
+    # Method signatures (structural only, not the body). Access modifiers
+    # and return types come from a small vocabulary, so intern them to
+    # share one object per distinct value across the whole corpus.
+    for match in _METHOD_RE.finditer(content):
+        methods.append({
+            "access": sys.intern(match.group(1)),
+            "returnType": sys.intern(match.group(2)),
+            "name": match.group(3),
+            "paramCount": len([p for p in match.group(4).split(",") if p.strip()]),
+        })
+
+    # SOQL patterns (structure, not specific queries)
+    for match in _SOQL_RE.finditer(content):
+        obj: str = match.group(2)
+        soql_patterns.append({"object": obj})
+        if obj not in objects_referenced:
+            objects_referenced.append(obj)
+
+    # DML operations
+    for op, op_re in _DML_OPS:
+        if op in content_lower and op_re.search(content):
+            if op not in dml_operations:
+                dml_operations.append(op)
+
+    # Trigger handler detection
+    if "TriggerHandler" in content or "trigger" in class_name.lower():
+        is_trigger_handler = True
+
+    return {
+        "class_type": "standard",
+        "access_modifier": access_modifier,
+        "annotations": annotations,
+        "interfaces": interfaces,
+        "extends": extends,
+        "methods": methods,
+        "soql_patterns": soql_patterns,
+        "dml_operations": dml_operations,
+        "objects_referenced": objects_referenced,
+        "is_test": is_test,
+        "is_batch": is_batch,
+        "is_schedulable": is_schedulable,
+        "is_trigger_handler": is_trigger_handler,
+        "is_aura_enabled": is_aura_enabled,
+        "is_rest_resource": is_rest_resource,
+    }
@@ -6,16 +6,23 @@ class hierarchy, SOQL patterns - NOT proprietary business logic.
 
 from __future__ import annotations
 
-import re
 from pathlib import Path
 
 from ..anonymizer import anonymize_structure
-from ..base import BaseExtractor, ExtractedPattern
+from ..base import BaseExtractor, ExtractedPattern, prefixed_tag
+from ._apex_core import analyze_apex
+
+# Classes larger than this (typically generated code) are skipped, and
+# reported as scan errors, so a few mega-classes can't dominate
+# extraction time.
+MAX_APEX_BYTES = 1024 * 1024
 
 
 class ApexExtractor(BaseExtractor):
     """Extract structural patterns from Apex classes."""
 
+    max_bytes = MAX_APEX_BYTES
+
     def extract(self, file_path: Path) -> list[ExtractedPattern]:
         if file_path.suffix != ".cls":
             return []
@@ -79,7 +86,7 @@ class ApexExtractor(BaseExtractor):
         )
         pattern.tags = self._auto_tags(pattern)
         for ann in analysis.get("annotations", []):
-            pattern.tags.append(f"annotation:{ann.lower()}")
+            pattern.tags.append(prefixed_tag("annotation", ann.lower()))
         if analysis.get("is_batch"):
             pattern.tags.append("batch")
         if analysis.get("is_schedulable"):
@@ -90,101 +97,25 @@ class ApexExtractor(BaseExtractor):
         return [pattern]
 
     def _read_file(self, path: Path) -> str:
+        """Read a class file, returning "" for unreadable or blank files.
+
+        Blank files are rejected on the raw bytes so they are never decoded;
+        oversized ones are never read past the size cap, and raise so the
+        scan records them as skipped.
+        """
         try:
-            return path.read_text(encoding="utf-8", errors="replace")
+            with path.open("rb") as fh:
+                data = fh.read(self.max_bytes + 1)
         except OSError:
             return ""
+        if len(data) > self.max_bytes:
+            raise ValueError(f"class is larger than {self.max_bytes} bytes, skipped")
+        if not data.strip():
+            return ""
+        return data.decode("utf-8", errors="replace")
 
     def _analyze_apex(self, content: str, class_name: str) -> dict:
-        analysis = {
-            "class_type": "standard",
-            "access_modifier": "public",
-            "annotations": [],
-            "interfaces": [],
-            "extends": "",
-            "methods": [],
-            "soql_patterns": [],
-            "dml_operations": [],
-            "objects_referenced": [],
-            "is_test": False,
-            "is_batch": False,
-            "is_schedulable": False,
-            "is_trigger_handler": False,
-            "is_aura_enabled": False,
-            "is_rest_resource": False,
-        }
-
-        # Class-level annotations
-        for match in re.finditer(r"@(\w+)(?:\([^)]*\))?", content):
-            ann = match.group(1)
-            if ann not in analysis["annotations"]:
-                analysis["annotations"].append(ann)
-            if ann == "isTest" or ann == "IsTest":
-                analysis["is_test"] = True
-            if ann == "AuraEnabled":
-                analysis["is_aura_enabled"] = True
-            if ann == "RestResource":
-                analysis["is_rest_resource"] = True
-
-        # Test class detection
-        if "@isTest" in content.lower() or "testmethod" in content.lower():
-            analysis["is_test"] = True
-
-        # Class declaration
-        class_match = re.search(
-            r"(public|private|global)\s+"
-            r"(?:(virtual|abstract|with sharing|without sharing|inherited sharing)\s+)*"
-            r"class\s+\w+\s*"
-            r"(?:extends\s+(\w+))?\s*"
-            r"(?:implements\s+([\w\s,]+))?\s*\{",
-            content,
-        )
-        if class_match:
-            analysis["access_modifier"] = class_match.group(1)
-            if class_match.group(3):
-                analysis["extends"] = class_match.group(3)
-            if class_match.group(4):
-                interfaces = [i.strip() for i in class_match.group(4).split(",")]
-                analysis["interfaces"] = interfaces
-                if "Database.Batchable" in class_match.group(4):
-                    analysis["is_batch"] = True
-                if "Schedulable" in class_match.group(4):
-                    analysis["is_schedulable"] = True
-
-        # Method signatures (structural only, not the body)
-        for match in re.finditer(
-            r"(public|private|global|protected)\s+"
-            r"(?:static\s+)?"
-            r"(\w+(?:<[\w,\s]+>)?)\s+"
-            r"(\w+)\s*\(([^)]*)\)",
-            content,
-        ):
-            method = {
-                "access": match.group(1),
-                "returnType": match.group(2),
-                "name": match.group(3),
-                "paramCount": len([p for p in match.group(4).split(",") if p.strip()]),
-            }
-            analysis["methods"].append(method)
-
-        # SOQL patterns (structure, not specific queries)
-        for match in re.finditer(r"\[SELECT\s+(.+?)\s+FROM\s+(\w+)", content, re.IGNORECASE):
-            obj = match.group(2)
-            analysis["soql_patterns"].append({"object": obj})
-            if obj not in analysis["objects_referenced"]:
-                analysis["objects_referenced"].append(obj)
-
-        # DML operations
-        for op in ["insert", "update", "upsert", "delete", "undelete", "merge"]:
-            if re.search(rf"\b{op}\s+\w+", content, re.IGNORECASE):
-                if op not in analysis["dml_operations"]:
-                    analysis["dml_operations"].append(op)
-
-        # Trigger handler detection
-        if "TriggerHandler" in content or "trigger" in class_name.lower():
-            analysis["is_trigger_handler"] = True
-
-        return analysis
+        return analyze_apex(content, class_name)
 
     def _build_description(self, analysis: dict) -> str:
         parts = []
@@ -7,6 +7,7 @@ Extracts both a full-flow pattern and individual element patterns
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
 from ..anonymizer import anonymize_structure
 from ..base import (
@@ -17,23 +18,8 @@ from ..base import (
     find_text,
 )
 
-# Flow element tags we extract as individual patterns
-_ELEMENT_TAGS = [
-    "decisions",
-    "recordLookups",
-    "recordUpdates",
-    "recordCreates",
-    "recordDeletes",
-    "screens",
-    "assignments",
-    "loops",
-    "actionCalls",
-    "subflows",
-    "formulas",
-    "collectionProcessors",
-]
-
-# Map XML tags to pattern types
+# Flow element tags we extract as individual patterns, mapped to their
+# pattern types. Every extracted tag has an entry, so lookups never miss.
 _TAG_TO_TYPE = {
     "decisions": "flow_decision",
     "recordLookups": "flow_record_lookup",
@@ -49,6 +35,8 @@ _TAG_TO_TYPE = {
     "collectionProcessors": "flow_collection_processor",
 }
 
+_ELEMENT_TAGS = tuple(_TAG_TO_TYPE)
+
 
 class FlowExtractor(BaseExtractor):
     """Extract patterns from Salesforce Flow XML files."""
@@ -166,7 +154,7 @@ class FlowExtractor(BaseExtractor):
         """Extract a single flow element as a pattern."""
         name = find_text(element, "name", "unnamed")
         label = find_text(element, "label", name)
-        pattern_type = _TAG_TO_TYPE.get(tag, f"flow_{tag}")
+        pattern_type = _TAG_TO_TYPE[tag]
 
         # Build element structure
         raw_structure = element_to_dict(element)
@@ -226,6 +214,21 @@ class FlowExtractor(BaseExtractor):
         """Build a connection topology showing how elements connect."""
         connections = []
         ns = root.tag.split("}")[0] + "}" if "}" in root.tag else ""
+        target_tag = f"{ns}targetReference"
+        rules_tag = f"{ns}rules"
+        rule_connector_tag = f"{ns}connector"
+        rule_name_tag = f"{ns}name"
+        # Element-level connectors, in output order; decision rules are
+        # emitted between the leading and trailing groups.
+        leading = (
+            (f"{ns}connector", "next"),
+            (f"{ns}faultConnector", "fault"),
+        )
+        trailing = (
+            (f"{ns}defaultConnector", "default"),  # decisions
+            (f"{ns}nextValueConnector", "loop_next"),  # loops
+            (f"{ns}noMoreValuesConnector", "loop_done"),  # loops
+        )
 
         for tag in _ELEMENT_TAGS:
             for element in find_all(root, tag):
@@ -233,73 +236,35 @@ class FlowExtractor(BaseExtractor):
                 if not name:
                     continue
 
-                # Standard connector
-                connector = element.find(f"{ns}connector")
-                if connector is not None:
-                    target = connector.find(f"{ns}targetReference")
-                    if target is not None and target.text:
-                        connections.append({
-                            "from": name,
-                            "to": target.text,
-                            "type": "next",
-                        })
+                # One pass over the children replaces a find() per connector kind
+                first_child: dict[str, Any] = {}
+                rules = []
+                for child in element:
+                    if child.tag == rules_tag:
+                        rules.append(child)
+                    else:
+                        first_child.setdefault(child.tag, child)
 
-                # Fault connector
-                fault = element.find(f"{ns}faultConnector")
-                if fault is not None:
-                    target = fault.find(f"{ns}targetReference")
-                    if target is not None and target.text:
-                        connections.append({
-                            "from": name,
-                            "to": target.text,
-                            "type": "fault",
-                        })
+                for conn_tag, conn_type in leading:
+                    target = _connector_target(first_child.get(conn_tag), target_tag)
+                    if target:
+                        connections.append({"from": name, "to": target, "type": conn_type})
 
                 # Decision rules have connectors
-                for rule in element.findall(f"{ns}rules"):
-                    rule_connector = rule.find(f"{ns}connector")
-                    if rule_connector is not None:
-                        target = rule_connector.find(f"{ns}targetReference")
-                        if target is not None and target.text:
-                            rule_name = rule.find(f"{ns}name")
-                            connections.append({
-                                "from": name,
-                                "to": target.text,
-                                "type": f"rule:{rule_name.text if rule_name is not None else 'unnamed'}",
-                            })
-
-                # Default connector for decisions
-                default_conn = element.find(f"{ns}defaultConnector")
-                if default_conn is not None:
-                    target = default_conn.find(f"{ns}targetReference")
-                    if target is not None and target.text:
+                for rule in rules:
+                    target = _connector_target(rule.find(rule_connector_tag), target_tag)
+                    if target:
+                        rule_name = rule.find(rule_name_tag)
                         connections.append({
                             "from": name,
-                            "to": target.text,
-                            "type": "default",
+                            "to": target,
+                            "type": f"rule:{rule_name.text if rule_name is not None else 'unnamed'}",
                         })
 
-                # Next-value connector for loops
-                next_val = element.find(f"{ns}nextValueConnector")
-                if next_val is not None:
-                    target = next_val.find(f"{ns}targetReference")
-                    if target is not None and target.text:
-                        connections.append({
-                            "from": name,
-                            "to": target.text,
-                            "type": "loop_next",
-                        })
-
-                # No-more-values connector for loops
-                no_more = element.find(f"{ns}noMoreValuesConnector")
-                if no_more is not None:
-                    target = no_more.find(f"{ns}targetReference")
-                    if target is not None and target.text:
-                        connections.append({
-                            "from": name,
-                            "to": target.text,
-                            "type": "loop_done",
-                        })
+                for conn_tag, conn_type in trailing:
+                    target = _connector_target(first_child.get(conn_tag), target_tag)
+                    if target:
+                        connections.append({"from": name, "to": target, "type": conn_type})
 
         return connections
 
@@ -371,3 +336,11 @@ class FlowExtractor(BaseExtractor):
         if obj and obj != "Unknown":
             return f"{readable_tag} on {obj}: {label}"
         return f"{readable_tag}: {label}"
+
+
+def _connector_target(connector, target_tag: str) -> str | None:
+    """Return a connector's targetReference text, if it has one."""
+    if connector is None:
+        return None
+    target = connector.find(target_tag)
+    return target.text if target is not None and target.text else None
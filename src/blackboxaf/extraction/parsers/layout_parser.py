@@ -17,6 +17,9 @@ class LayoutExtractor(BaseExtractor):
             return []
 
         ns = root.tag.split("}")[0] + "}" if "}" in root.tag else ""
+        layout_items_tag = f"{ns}layoutItems"
+        fields_tag = f"{ns}fields"
+        quick_action_item_tag = f"{ns}quickActionListItems"
 
         # Layout name from filename
         layout_name = file_path.stem.replace(".layout-meta", "")
@@ -27,23 +30,21 @@ class LayoutExtractor(BaseExtractor):
 
         # Parse layout sections
         sections = []
-        field_refs = []
+        field_refs: set[str] = set()
+        field_count = 0
         for section in find_all(root, "layoutSections"):
             section_label = find_text(section, "label", "")
             style = find_text(section, "style", "")
             columns = find_all(section, "layoutColumns")
 
-            section_fields = []
-            for col in columns:
-                for item in col.findall(f"{ns}layoutItems"):
-                    behavior = find_text(item, "behavior", "")
-                    field = find_text(item, "field", "")
-                    if field:
-                        section_fields.append({
-                            "field": field,
-                            "behavior": behavior,
-                        })
-                        field_refs.append(field)
+            section_fields = [
+                {"field": field, "behavior": find_text(item, "behavior", "")}
+                for col in columns
+                for item in col.findall(layout_items_tag)
+                if (field := find_text(item, "field", ""))
+            ]
+            field_refs.update(f["field"] for f in section_fields)
+            field_count += len(section_fields)
 
             sections.append({
                 "label": section_label,
@@ -59,14 +60,14 @@ class LayoutExtractor(BaseExtractor):
             related_lists.append({
                 "relatedList": find_text(rl, "relatedList", ""),
                 "fields": [
-                    el.text for el in rl.findall(f"{ns}fields") if el.text
+                    el.text for el in rl.findall(fields_tag) if el.text
                 ],
             })
 
         # Quick actions
         quick_actions = []
         for qa in find_all(root, "quickActionList"):
-            for item in qa.findall(f"{ns}quickActionListItems"):
+            for item in qa.findall(quick_action_item_tag):
                 quick_actions.append(find_text(item, "quickActionName", ""))
 
         structure = {
@@ -74,11 +75,11 @@ class LayoutExtractor(BaseExtractor):
             "sections": sections,
             "relatedLists": related_lists,
             "quickActions": [q for q in quick_actions if q],
-            "totalFields": len(field_refs),
+            "totalFields": field_count,
         }
 
         factors = {
-            "fields": len(field_refs),
+            "fields": field_count,
             "elements": len(sections) + len(related_lists),
         }
 
@@ -87,10 +88,10 @@ class LayoutExtractor(BaseExtractor):
             pattern_type="layout_definition",
             category="Page Layout",
             name=f"Layout: {source_object} - {display_name.replace('_', ' ')}",
-            description=f"Page layout for {source_object} with {len(sections)} sections and {len(field_refs)} fields.",
+            description=f"Page layout for {source_object} with {len(sections)} sections and {field_count} fields.",
             source_object=source_object,
             structure=anonymized,
-            field_references=sorted(set(field_refs)),
+            field_references=sorted(field_refs),
             api_version="",
             complexity_score=self._compute_complexity(factors),
             source_hash=self.source_hash,
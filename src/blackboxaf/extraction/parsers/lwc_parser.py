@@ -8,11 +8,79 @@ Extracts structural patterns from LWC bundles:
 
 from __future__ import annotations
 
+import os
 import re
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from ..anonymizer import anonymize_structure
-from ..base import BaseExtractor, ExtractedPattern
+from ..base import BaseExtractor, ExtractedPattern, prefixed_tag
+
+# JS analysis
+_API_PROP_RE = re.compile(r"@api\s+(\w+)")
+_TRACK_RE = re.compile(r"@track\s+(\w+)")
+_WIRE_RE = re.compile(r"@wire\((\w+)(?:,\s*\{[^}]*\})?\)")
+_APEX_IMPORT_RE = re.compile(
+    r"import\s+(\w+)\s+from\s+['\"]@salesforce/apex/(\w+\.\w+)['\"]"
+)
+_SCHEMA_IMPORT_RE = re.compile(
+    r"import\s+\w+\s+from\s+['\"]@salesforce/schema/(\w+\.\w+)['\"]"
+)
+_HANDLER_RE = re.compile(r"(handle\w+)\s*\(")
+_LIFECYCLE_HOOKS = ("connectedCallback", "disconnectedCallback", "renderedCallback", "errorCallback")
+
+# HTML analysis
+_CHILD_COMP_RE = re.compile(r"<(c-\w+|lightning-\w+)")
+_COND_RE = re.compile(r"(?:if:true|if:false|lwc:if|lwc:elseif)=\{([^}]+)\}")
+_ITER_RE = re.compile(r"for:each=\{([^}]+)\}")
+
+# Meta XML analysis
+_API_VERSION_RE = re.compile(r"<apiVersion>([\d.]+)</apiVersion>")
+_TARGET_RE = re.compile(r"<target>([\w:]+)</target>")
+_OBJECT_BINDING_RE = re.compile(r"<objects>\s*<object>(\w+)</object>")
+
+_CAMEL_RE = re.compile(r"[A-Z]")
+
+
+# Per-file analyses. Field order is the key order they are emitted with.
+@dataclass(slots=True)
+class _JsAnalysis:
+    api_properties: list[str] = field(default_factory=list)
+    tracked_properties: list[str] = field(default_factory=list)
+    wire_adapters: list[str] = field(default_factory=list)
+    apex_calls: list[dict[str, str]] = field(default_factory=list)
+    event_handlers: list[str] = field(default_factory=list)
+    navigation: bool = False
+    toast: bool = False
+    lifecycle_hooks: list[str] = field(default_factory=list)
+    field_references: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _HtmlAnalysis:
+    child_components: list[str] = field(default_factory=list)
+    conditionals: list[str] = field(default_factory=list)
+    iterations: list[str] = field(default_factory=list)
+    slots: bool = False
+    forms: bool = False
+
+
+@dataclass(slots=True)
+class _MetaAnalysis:
+    apiVersion: str = ""
+    isExposed: bool = False
+    targets: list[str] = field(default_factory=list)
+    primaryObject: str = "Unknown"
+
+
+# Stand-ins read when a bundle has no template or meta file
+_NO_HTML = _HtmlAnalysis()
+_NO_META = _MetaAnalysis()
+
+
+def _as_dict(analysis) -> dict:
+    """An analysis as the plain dict stored in the structure, in field order."""
+    return {name: getattr(analysis, name) for name in analysis.__dataclass_fields__}
 
 
 class LWCExtractor(BaseExtractor):
@@ -24,55 +92,65 @@ class LWCExtractor(BaseExtractor):
         file_path should point to the component's .js file.
         We'll also look for adjacent .html and .js-meta.xml.
         """
-        if file_path.suffix != ".js":
+        # Plain string operations from here on; pathlib's suffix, stem,
+        # parent and / each build new objects per call
+        file_name = file_path.name
+        if len(file_name) <= 3 or not file_name.endswith(".js"):
             return []
 
         # Skip test files
-        if "__tests__" in str(file_path):
+        path_str = os.fspath(file_path)
+        if "__tests__" in path_str:
             return []
 
-        component_name = file_path.stem
-        bundle_dir = file_path.parent
+        component_name = file_name[:-3]
+        bundle_dir = os.path.dirname(path_str)
 
         # Read the main JS file
-        js_content = self._read_file(file_path)
+        js_content = self._read_file(path_str)
         if not js_content:
             return []
 
+        # One listing of the bundle tells us which siblings exist, so a
+        # missing template or meta file costs no failed open()
+        siblings = self._list_bundle(bundle_dir)
+
         # Read HTML template if it exists
-        html_path = bundle_dir / f"{component_name}.html"
-        html_content = self._read_file(html_path)
+        html_path = siblings.get(f"{component_name}.html")
+        html_content = self._read_file(html_path) if html_path else ""
 
         # Read meta XML if it exists
-        meta_path = bundle_dir / f"{component_name}.js-meta.xml"
-        meta_content = self._read_file(meta_path)
+        meta_path = siblings.get(f"{component_name}.js-meta.xml")
+        meta_content = self._read_file(meta_path) if meta_path else ""
 
         # Analyze JS file
         js_analysis = self._analyze_js(js_content)
 
         # Analyze HTML template
-        html_analysis = self._analyze_html(html_content) if html_content else {}
+        html_analysis = self._analyze_html(html_content) if html_content else None
 
         # Analyze meta XML
-        meta_analysis = self._analyze_meta(meta_content) if meta_content else {}
+        meta_analysis = self._analyze_meta(meta_content) if meta_content else None
 
         structure = {
             "componentName": component_name,
-            "js": js_analysis,
-            "html": html_analysis,
-            "meta": meta_analysis,
+            "js": _as_dict(js_analysis),
+            "html": _as_dict(html_analysis) if html_analysis else {},
+            "meta": _as_dict(meta_analysis) if meta_analysis else {},
         }
+        html = html_analysis or _NO_HTML
+        meta = meta_analysis or _NO_META
 
         # Compute complexity
         factors = {
-            "fields": len(js_analysis.get("api_properties", [])),
+            "fields": len(js_analysis.api_properties),
             "elements": (
-                len(js_analysis.get("wire_adapters", []))
-                + len(js_analysis.get("apex_calls", []))
-                + len(html_analysis.get("child_components", []))
+                len(js_analysis.wire_adapters)
+                + len(js_analysis.apex_calls)
+                + len(html.child_components)
             ),
-            "conditions": len(html_analysis.get("conditionals", [])),
-            "loops": len(html_analysis.get("iterations", [])),
+            "conditions": len(html.conditionals),
+            "loops": len(html.iterations),
         }
 
         anonymized = anonymize_structure(structure)
@@ -80,174 +158,132 @@ class LWCExtractor(BaseExtractor):
             pattern_type="lwc_component",
             category="UI Component",
             name=f"LWC: {self._format_component_name(component_name)}",
-            description=self._build_description(js_analysis, html_analysis, meta_analysis),
-            source_object=meta_analysis.get("primaryObject", "Unknown"),
+            description=self._build_description(js_analysis, html, meta),
+            source_object=meta.primaryObject,
             structure=anonymized,
-            field_references=js_analysis.get("field_references", []),
-            api_version=meta_analysis.get("apiVersion", ""),
+            field_references=js_analysis.field_references,
+            api_version=meta.apiVersion,
             complexity_score=self._compute_complexity(factors),
             source_hash=self.source_hash,
             source_file=str(file_path.name),
         )
         pattern.tags = self._auto_tags(pattern)
-        if js_analysis.get("wire_adapters"):
+        if js_analysis.wire_adapters:
             pattern.tags.append("uses-wire")
-        if js_analysis.get("apex_calls"):
+        if js_analysis.apex_calls:
             pattern.tags.append("calls-apex")
-        if js_analysis.get("navigation"):
+        if js_analysis.navigation:
             pattern.tags.append("uses-navigation")
-        for target in meta_analysis.get("targets", []):
-            pattern.tags.append(f"target:{target}")
+        for target in meta.targets:
+            pattern.tags.append(prefixed_tag("target", target))
 
         return [pattern]
 
-    def _read_file(self, path: Path) -> str:
+    def _list_bundle(self, bundle_dir: str) -> dict[str, str]:
+        """Map file names in a bundle directory to their paths."""
+        try:
+            with os.scandir(bundle_dir) as entries:
+                return {entry.name: entry.path for entry in entries if entry.is_file()}
+        except OSError:
+            return {}
+
+    def _read_file(self, path: str) -> str:
         """Read a file's content, return empty string on failure."""
         try:
-            return path.read_text(encoding="utf-8", errors="replace")
+            with open(path, encoding="utf-8", errors="replace") as f:
+                return f.read()
         except OSError:
             return ""
 
-    def _analyze_js(self, content: str) -> dict:
+    def _analyze_js(self, content: str) -> _JsAnalysis:
         """Analyze a LWC JavaScript file for structural patterns."""
-        analysis = {
-            "api_properties": [],
-            "tracked_properties": [],
-            "wire_adapters": [],
-            "apex_calls": [],
-            "event_handlers": [],
-            "navigation": False,
-            "toast": False,
-            "lifecycle_hooks": [],
-            "field_references": [],
-        }
-
-        # @api properties
-        for match in re.finditer(r"@api\s+(\w+)", content):
-            analysis["api_properties"].append(match.group(1))
-
-        # @track properties (deprecated but still common)
-        for match in re.finditer(r"@track\s+(\w+)", content):
-            analysis["tracked_properties"].append(match.group(1))
-
-        # @wire decorators
-        for match in re.finditer(r"@wire\((\w+)(?:,\s*\{([^}]*)\})?\)", content):
-            adapter = match.group(1)
-            analysis["wire_adapters"].append(adapter)
-
-        # Apex imports
-        for match in re.finditer(r"import\s+(\w+)\s+from\s+['\"]@salesforce/apex/(\w+\.\w+)['\"]", content):
-            analysis["apex_calls"].append({
-                "localName": match.group(1),
-                "method": match.group(2),
-            })
-
-        # Schema field imports
-        for match in re.finditer(r"import\s+\w+\s+from\s+['\"]@salesforce/schema/(\w+\.\w+)['\"]", content):
-            analysis["field_references"].append(match.group(1))
-
-        # Event handlers
-        for match in re.finditer(r"handle\w+\s*\(", content):
-            analysis["event_handlers"].append(match.group(0).rstrip("(").strip())
+        analysis = _JsAnalysis(
+            api_properties=_API_PROP_RE.findall(content),
+            # @track properties (deprecated but still common)
+            tracked_properties=_TRACK_RE.findall(content),
+            wire_adapters=_WIRE_RE.findall(content),
+            # Apex imports
+            apex_calls=[
+                {"localName": match.group(1), "method": match.group(2)}
+                for match in _APEX_IMPORT_RE.finditer(content)
+            ],
+            event_handlers=_HANDLER_RE.findall(content),
+            # Schema field imports
+            field_references=_SCHEMA_IMPORT_RE.findall(content),
+        )
 
-        # Navigation
-        if "NavigationMixin" in content or "this[NavigationMixin.Navigate]" in content:
-            analysis["navigation"] = True
+        # Navigation (also covers this[NavigationMixin.Navigate])
+        if "NavigationMixin" in content:
+            analysis.navigation = True
 
         # Toast messages
         if "ShowToastEvent" in content:
-            analysis["toast"] = True
+            analysis.toast = True
 
         # Lifecycle hooks
-        for hook in ["connectedCallback", "disconnectedCallback", "renderedCallback", "errorCallback"]:
+        for hook in _LIFECYCLE_HOOKS:
             if hook in content:
-                analysis["lifecycle_hooks"].append(hook)
+                analysis.lifecycle_hooks.append(hook)
 
         return analysis
 
-    def _analyze_html(self, content: str) -> dict:
+    def _analyze_html(self, content: str) -> _HtmlAnalysis:
         """Analyze a LWC HTML template for structural patterns."""
-        analysis = {
-            "child_components": [],
-            "conditionals": [],
-            "iterations": [],
-            "slots": False,
-            "forms": False,
-        }
-
-        # Custom child components (c-xxx or lightning-xxx)
-        for match in re.finditer(r"<(c-\w+|lightning-\w+)", content):
-            comp = match.group(1)
-            if comp not in analysis["child_components"]:
-                analysis["child_components"].append(comp)
-
-        # Conditionals
-        analysis["conditionals"] = [
-            m.group(1) for m in re.finditer(r"(?:if:true|if:false|lwc:if|lwc:elseif)=\{([^}]+)\}", content)
-        ]
-
-        # Iterations
-        analysis["iterations"] = [
-            m.group(1) for m in re.finditer(r"for:each=\{([^}]+)\}", content)
-        ]
-
-        # Slots
-        if "<slot" in content:
-            analysis["slots"] = True
-
-        # Form elements
-        if "lightning-input" in content or "lightning-combobox" in content:
-            analysis["forms"] = True
-
-        return analysis
+        return _HtmlAnalysis(
+            # Custom child components (c-xxx or lightning-xxx)
+            child_components=list(dict.fromkeys(_CHILD_COMP_RE.findall(content))),
+            conditionals=_COND_RE.findall(content),
+            iterations=_ITER_RE.findall(content),
+            slots="<slot" in content,
+            # Form elements
+            forms="lightning-input" in content or "lightning-combobox" in content,
+        )
 
-    def _analyze_meta(self, content: str) -> dict:
+    def _analyze_meta(self, content: str) -> _MetaAnalysis:
         """Analyze a .js-meta.xml file."""
-        analysis = {
-            "apiVersion": "",
-            "isExposed": False,
-            "targets": [],
-            "primaryObject": "Unknown",
-        }
+        analysis = _MetaAnalysis()
 
         # API version
-        match = re.search(r"<apiVersion>([\d.]+)</apiVersion>", content)
+        match = _API_VERSION_RE.search(content)
         if match:
-            analysis["apiVersion"] = match.group(1)
+            analysis.apiVersion = match.group(1)
 
         # Exposed
         if "<isExposed>true</isExposed>" in content:
-            analysis["isExposed"] = True
+            analysis.isExposed = True
 
         # Targets
-        for match in re.finditer(r"<target>([\w:]+)</target>", content):
-            target = match.group(1).split("__")[-1]
-            analysis["targets"].append(target)
+        analysis.targets = [
+            target.split("__")[-1] for target in _TARGET_RE.findall(content)
+        ]
 
         # Object binding
-        match = re.search(r"<objects>\s*<object>(\w+)</object>", content)
+        match = _OBJECT_BINDING_RE.search(content)
         if match:
-            analysis["primaryObject"] = match.group(1)
+            analysis.primaryObject = match.group(1)
 
         return analysis
 
     def _format_component_name(self, name: str) -> str:
         """Convert camelCase component name to readable form."""
-        return re.sub(r"([A-Z])", r" \1", name).strip().title()
+        if not name.islower():
+            # A function replacement skips re's template expansion per match
+            name = _CAMEL_RE.sub(lambda m: " " + m.group(), name)
+        return name.strip().title()
 
-    def _build_description(self, js: dict, html: dict, meta: dict) -> str:
+    def _build_description(self, js: _JsAnalysis, html: _HtmlAnalysis, meta: _MetaAnalysis) -> str:
         parts = ["Lightning Web Component"]
-        if meta.get("targets"):
-            parts.append(f"for {', '.join(meta['targets'][:3])}")
+        if meta.targets:
+            parts.append(f"for {', '.join(meta.targets[:3])}")
         features = []
-        if js.get("wire_adapters"):
-            features.append(f"{len(js['wire_adapters'])} wire adapters")
-        if js.get("apex_calls"):
-            features.append(f"{len(js['apex_calls'])} Apex calls")
-        if js.get("api_properties"):
-            features.append(f"{len(js['api_properties'])} @api props")
-        if html.get("child_components"):
-            features.append(f"{len(html['child_components'])} child components")
+        if js.wire_adapters:
+            features.append(f"{len(js.wire_adapters)} wire adapters")
+        if js.apex_calls:
+            features.append(f"{len(js.apex_calls)} Apex calls")
+        if js.api_properties:
+            features.append(f"{len(js.api_properties)} @api props")
+        if html.child_components:
+            features.append(f"{len(html.child_components)} child components")
         if features:
             parts.append(f"with {', '.join(features)}")
         return " ".join(parts) + "."
@@ -8,48 +8,72 @@ from ..anonymizer import anonymize_structure
 from ..base import (
     BaseExtractor,
     ExtractedPattern,
+    child_texts,
     element_to_dict,
     find_all,
     find_text,
+    prefixed_tag,
+    qualified_tag,
+    root_namespace,
+    sf_tags,
+)
+
+# Top-level tags read from each document, gathered in one pass over the root
+_OBJECT_TAGS = sf_tags(
+    "sharingModel", "deploymentStatus", "enableActivities",
+    "enableHistory", "enableReports", "enableSearch",
+)
+_FIELD_TAGS = sf_tags(
+    "fullName", "type", "label", "required", "unique", "externalId",
+    "length", "precision", "scale", "defaultValue", "formula",
+    "referenceTo", "relationshipName", "deleteConstraint",
+    "formulaTreatBlanksAs",
 )
 
 
 class ObjectExtractor(BaseExtractor):
     """Extract patterns from Salesforce Object/Field XML files."""
 
+    # Handler method for each file kind, keyed on the last two
+    # dot-separated parts of the file name
+    _HANDLERS = {
+        "object-meta.xml": "_extract_object",
+        "field-meta.xml": "_extract_field",
+    }
+
     def extract(self, file_path: Path) -> list[ExtractedPattern]:
+        parts = file_path.name.rsplit(".", 2)
+        handler = self._HANDLERS.get(f"{parts[1]}.{parts[2]}") if len(parts) == 3 else None
+        if handler is None:
+            return []
+
         root = self._parse_xml(file_path)
         if root is None:
             return []
 
-        file_name = file_path.name
-
-        if file_name.endswith(".object-meta.xml"):
-            return self._extract_object(root, file_path)
-        elif file_name.endswith(".field-meta.xml"):
-            return self._extract_field(root, file_path)
-        else:
-            return []
+        return getattr(self, handler)(root, file_path)
 
     def _extract_object(self, root, file_path: Path) -> list[ExtractedPattern]:
         """Extract pattern from a custom object definition."""
         obj_name = file_path.stem.replace(".object-meta", "")
 
         # Gather object-level configuration
+        texts = child_texts(root, _OBJECT_TAGS)
         structure = {
             "objectName": obj_name,
-            "sharingModel": find_text(root, "sharingModel", ""),
-            "deploymentStatus": find_text(root, "deploymentStatus", ""),
-            "enableActivities": find_text(root, "enableActivities", ""),
-            "enableHistory": find_text(root, "enableHistory", ""),
-            "enableReports": find_text(root, "enableReports", ""),
-            "enableSearch": find_text(root, "enableSearch", ""),
+            "sharingModel": texts.get("sharingModel", ""),
+            "deploymentStatus": texts.get("deploymentStatus", ""),
+            "enableActivities": texts.get("enableActivities", ""),
+            "enableHistory": texts.get("enableHistory", ""),
+            "enableReports": texts.get("enableReports", ""),
+            "enableSearch": texts.get("enableSearch", ""),
             "nameFieldType": "",
             "actionOverrides": [],
         }
 
         # Name field info
-        name_field = root.find(f".//{{{root.tag.split('}')[0][1:]}}}nameField")
+        ns = root_namespace(root)
+        name_field = next(root.iter(qualified_tag(ns, "nameField")), None) if ns else None
         if name_field is not None:
             structure["nameFieldType"] = find_text(name_field, "type", "")
 
@@ -86,20 +110,21 @@ class ObjectExtractor(BaseExtractor):
 
     def _extract_field(self, root, file_path: Path) -> list[ExtractedPattern]:
         """Extract pattern from a custom field definition."""
-        full_name = find_text(root, "fullName", file_path.stem.replace(".field-meta", ""))
-        field_type = find_text(root, "type", "Unknown")
-        label = find_text(root, "label", full_name)
-        required = find_text(root, "required", "false")
-        unique = find_text(root, "unique", "false")
-        external_id = find_text(root, "externalId", "false")
-        length = find_text(root, "length", "")
-        precision = find_text(root, "precision", "")
-        scale = find_text(root, "scale", "")
-        default_value = find_text(root, "defaultValue", "")
-        formula = find_text(root, "formula", "")
-        reference_to = find_text(root, "referenceTo", "")
-        relationship_name = find_text(root, "relationshipName", "")
-        delete_constraint = find_text(root, "deleteConstraint", "")
+        texts = child_texts(root, _FIELD_TAGS)
+        full_name = texts.get("fullName", file_path.stem.replace(".field-meta", ""))
+        field_type = texts.get("type", "Unknown")
+        label = texts.get("label", full_name)
+        required = texts.get("required", "false")
+        unique = texts.get("unique", "false")
+        external_id = texts.get("externalId", "false")
+        length = texts.get("length", "")
+        precision = texts.get("precision", "")
+        scale = texts.get("scale", "")
+        default_value = texts.get("defaultValue", "")
+        formula = texts.get("formula", "")
+        reference_to = texts.get("referenceTo", "")
+        relationship_name = texts.get("relationshipName", "")
+        delete_constraint = texts.get("deleteConstraint", "")
 
         # Detect parent object from path
         source_object = self._detect_object_from_path(file_path)
@@ -122,14 +147,15 @@ class ObjectExtractor(BaseExtractor):
             structure["hasDefaultValue"] = True
         if formula:
             structure["isFormula"] = True
-            structure["formulaReturnType"] = find_text(root, "formulaTreatBlanksAs", "")
+            structure["formulaReturnType"] = texts.get("formulaTreatBlanksAs", "")
         if reference_to:
             structure["referenceTo"] = reference_to
             structure["relationshipName"] = relationship_name
             structure["deleteConstraint"] = delete_constraint
 
         # Picklist values (just the structure, not specific values)
-        value_set = root.find(f".//{{{root.tag.split('}')[0][1:]}}}valueSet")
+        ns = root_namespace(root)
+        value_set = next(root.iter(qualified_tag(ns, "valueSet")), None) if ns else None
         if value_set is not None:
             structure["hasPicklist"] = True
             restricted = find_text(value_set, "restricted", "false")
@@ -159,7 +185,7 @@ class ObjectExtractor(BaseExtractor):
             source_file=str(file_path.name),
         )
         pattern.tags = self._auto_tags(pattern)
-        pattern.tags.append(f"type:{field_type.lower()}")
+        pattern.tags.append(prefixed_tag("type", field_type.lower()))
         if formula:
             pattern.tags.append("formula-field")
         if reference_to:
@@ -168,10 +194,11 @@ class ObjectExtractor(BaseExtractor):
 
     def _detect_object_from_path(self, file_path: Path) -> str:
         parts = file_path.parts
-        for i, part in enumerate(parts):
-            if part == "objects" and i + 1 < len(parts):
-                return parts[i + 1]
-        return "Unknown"
+        try:
+            i = parts.index("objects")
+        except ValueError:
+            return "Unknown"
+        return parts[i + 1] if i + 1 < len(parts) else "Unknown"
 
     def _build_description(self, name: str, ftype: str, obj: str, ref_to: str) -> str:
         parts = [f"{ftype} field"]
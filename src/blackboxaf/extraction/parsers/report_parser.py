@@ -2,81 +2,136 @@
 
 from __future__ import annotations
 
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
 from ..anonymizer import anonymize_structure
-from ..base import BaseExtractor, ExtractedPattern, find_all, find_text
+from ..base import (
+    BaseExtractor,
+    ExtractedPattern,
+    child_texts,
+    find_all,
+    find_text,
+    prefixed_tag,
+    qualified_tag,
+    root_namespace,
+    sf_tags,
+)
+
+# Direct children of the root that carry report sections
+_SECTION_TAGS = sf_tags(
+    "columns", "filter", "groupingsDown", "groupingsAcross",
+    "customDetailFormulas", "customSummaryFormulas",
+)
+
+# Child tags read from each element type, gathered in one pass per element
+_REPORT_TAGS = sf_tags("name", "reportType", "format", "apiVersion")
+_COLUMN_TAGS = sf_tags("field", "aggregateTypes")
+_CRITERIA_TAGS = sf_tags("column", "operator", "snapshot")
+_GROUPING_TAGS = sf_tags("field", "dateGranularity", "sortOrder")
+_FORMULA_TAGS = sf_tags("label", "formulaType", "formula")
+_CHART_TAGS = sf_tags("chartType", "enableHoverLabels", "legendPosition")
 
 
 class ReportExtractor(BaseExtractor):
     """Extract patterns from Salesforce Report XML files."""
 
     def extract(self, file_path: Path) -> list[ExtractedPattern]:
-        root = self._parse_xml(file_path)
-        if root is None:
-            return []
-
-        name = find_text(root, "name", file_path.stem)
-        report_type = find_text(root, "reportType", "Unknown")
-        format_type = find_text(root, "format", "Tabular")
-        api_version = find_text(root, "apiVersion", "")
-
-        # Columns
+        # Single streaming pass: each direct child of the root is handled
+        # at its end event and then cleared, so large reports never hold a
+        # full tree and are not re-walked once per section.
+        texts: dict[str, str] = {}
+        seen: set[str] = set()
         columns = []
-        for col in find_all(root, "columns"):
-            col_field = find_text(col, "field", "")
-            col_agg = find_text(col, "aggregateTypes", "")
-            if col_field:
-                columns.append({"field": col_field, "aggregate": col_agg})
-
-        # Filters
         filters = []
-        for flt in find_all(root, "filter"):
-            criteria_items = find_all(flt, "criteriaItems")
-            for ci in criteria_items:
-                filters.append({
-                    "column": find_text(ci, "column", ""),
-                    "operator": find_text(ci, "operator", ""),
-                    "snapshot": find_text(ci, "snapshot", ""),
-                })
-            bool_filter = find_text(flt, "booleanFilter", "")
-            if bool_filter:
-                filters.append({"booleanFilter": bool_filter})
-
-        # Groupings
-        groupings = []
-        for grp in find_all(root, "groupingsDown"):
-            groupings.append({
-                "field": find_text(grp, "field", ""),
-                "dateGranularity": find_text(grp, "dateGranularity", ""),
-                "sortOrder": find_text(grp, "sortOrder", ""),
-            })
-        for grp in find_all(root, "groupingsAcross"):
-            groupings.append({
-                "field": find_text(grp, "field", ""),
-                "dateGranularity": find_text(grp, "dateGranularity", ""),
-                "sortOrder": find_text(grp, "sortOrder", ""),
-                "direction": "across",
-            })
-
-        # Custom summary formulas
-        formulas = []
-        for csf in find_all(root, "customDetailFormulas") + find_all(root, "customSummaryFormulas"):
-            formulas.append({
-                "label": find_text(csf, "label", ""),
-                "formulaType": find_text(csf, "formulaType", ""),
-                "formula": find_text(csf, "formula", ""),
-            })
-
-        # Chart info
-        chart = root.find(f".//{{{root.tag.split('}')[0][1:]}}}chart") if root.tag and "}" in root.tag else None
+        groupings_down = []
+        groupings_across = []
+        detail_formulas = []
+        summary_formulas = []
+        chart_tag = None
+        chart = None
         chart_info = {}
-        if chart is not None:
-            chart_info = {
-                "chartType": find_text(chart, "chartType", ""),
-                "enableHoverLabels": find_text(chart, "enableHoverLabels", ""),
-                "legendPosition": find_text(chart, "legendPosition", ""),
-            }
+        depth = 0
+        try:
+            for event, elem in ET.iterparse(file_path, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    if depth == 1:
+                        ns = root_namespace(elem)
+                        chart_tag = qualified_tag(ns, "chart") if ns else None
+                    elif chart is None and elem.tag == chart_tag:
+                        chart = elem
+                    continue
+
+                depth -= 1
+                if elem is chart:
+                    chart_texts = child_texts(chart, _CHART_TAGS)
+                    chart_info = {
+                        "chartType": chart_texts.get("chartType", ""),
+                        "enableHoverLabels": chart_texts.get("enableHoverLabels", ""),
+                        "legendPosition": chart_texts.get("legendPosition", ""),
+                    }
+                if depth != 1:
+                    continue
+
+                tag = elem.tag
+                section = _SECTION_TAGS.get(tag)
+                if section == "columns":
+                    col_texts = child_texts(elem, _COLUMN_TAGS)
+                    col_field = col_texts.get("field", "")
+                    if col_field:
+                        columns.append({"field": col_field, "aggregate": col_texts.get("aggregateTypes", "")})
+                elif section == "filter":
+                    for ci in find_all(elem, "criteriaItems"):
+                        ci_texts = child_texts(ci, _CRITERIA_TAGS)
+                        filters.append({
+                            "column": ci_texts.get("column", ""),
+                            "operator": ci_texts.get("operator", ""),
+                            "snapshot": ci_texts.get("snapshot", ""),
+                        })
+                    bool_filter = find_text(elem, "booleanFilter", "")
+                    if bool_filter:
+                        filters.append({"booleanFilter": bool_filter})
+                elif section == "groupingsDown":
+                    grp_texts = child_texts(elem, _GROUPING_TAGS)
+                    groupings_down.append({
+                        "field": grp_texts.get("field", ""),
+                        "dateGranularity": grp_texts.get("dateGranularity", ""),
+                        "sortOrder": grp_texts.get("sortOrder", ""),
+                    })
+                elif section == "groupingsAcross":
+                    grp_texts = child_texts(elem, _GROUPING_TAGS)
+                    groupings_across.append({
+                        "field": grp_texts.get("field", ""),
+                        "dateGranularity": grp_texts.get("dateGranularity", ""),
+                        "sortOrder": grp_texts.get("sortOrder", ""),
+                        "direction": "across",
+                    })
+                elif section is not None:
+                    csf_texts = child_texts(elem, _FORMULA_TAGS)
+                    target = detail_formulas if section == "customDetailFormulas" else summary_formulas
+                    target.append({
+                        "label": csf_texts.get("label", ""),
+                        "formulaType": csf_texts.get("formulaType", ""),
+                        "formula": csf_texts.get("formula", ""),
+                    })
+                else:
+                    # Top-level scalar; first occurrence wins, as with find_text
+                    text_name = _REPORT_TAGS.get(tag)
+                    if text_name is not None and text_name not in seen:
+                        seen.add(text_name)
+                        if elem.text:
+                            texts[text_name] = elem.text.strip()
+                elem.clear()
+        except (ET.ParseError, OSError):
+            return []
+
+        name = texts.get("name", file_path.stem)
+        report_type = texts.get("reportType", "Unknown")
+        format_type = texts.get("format", "Tabular")
+        api_version = texts.get("apiVersion", "")
+        groupings = groupings_down + groupings_across
+        formulas = detail_formulas + summary_formulas
 
         # Field references
         field_refs = [c["field"] for c in columns if c["field"]]
@@ -117,7 +172,7 @@ class ReportExtractor(BaseExtractor):
             source_file=str(file_path.name),
         )
         pattern.tags = self._auto_tags(pattern)
-        pattern.tags.append(f"format:{format_type.lower()}")
+        pattern.tags.append(prefixed_tag("format", format_type.lower()))
         if chart_info:
             pattern.tags.append("has-chart")
         if formulas:
@@ -2,10 +2,32 @@
 
 from __future__ import annotations
 
+import re
+from itertools import accumulate
 from pathlib import Path
 
 from ..anonymizer import anonymize_structure, extract_field_refs_from_formula
-from ..base import BaseExtractor, ExtractedPattern, find_text
+from ..base import BaseExtractor, ExtractedPattern, find_text, prefixed_tag
+
+# Formula functions we detect, in the order they are reported, paired
+# with their call probe ("AND(")
+_SF_FUNCTIONS = (
+    "AND", "OR", "NOT", "IF", "CASE", "ISBLANK", "ISNULL",
+    "ISPICKVAL", "ISCHANGED", "ISNEW", "PRIORVALUE",
+    "TEXT", "VALUE", "LEN", "LEFT", "RIGHT", "MID",
+    "CONTAINS", "BEGINS", "INCLUDES",
+    "TODAY", "NOW", "DATEVALUE", "DATETIMEVALUE",
+    "YEAR", "MONTH", "DAY",
+    "REGEX", "SUBSTITUTE", "TRIM",
+    "NULLVALUE", "BLANKVALUE",
+    "HYPERLINK", "IMAGE",
+)
+
+_SF_FUNCTION_PROBES = tuple((func, func + "(") for func in _SF_FUNCTIONS)
+
+# Everything except parentheses, and the depth step of each parenthesis
+_NON_PAREN_RE = re.compile(r"[^()]+")
+_PAREN_STEP = {"(": 1, ")": -1}
 
 
 class ValidationRuleExtractor(BaseExtractor):
@@ -67,17 +89,18 @@ class ValidationRuleExtractor(BaseExtractor):
         if active == "true":
             pattern.tags.append("active")
         for func in formula_analysis.get("functions_used", []):
-            pattern.tags.append(f"func:{func.lower()}")
+            pattern.tags.append(prefixed_tag("func", func.lower()))
 
         return [pattern]
 
     def _detect_object_from_path(self, file_path: Path) -> str:
         """Detect the parent object from the validation rule file path."""
         parts = file_path.parts
-        for i, part in enumerate(parts):
-            if part == "objects" and i + 1 < len(parts):
-                return parts[i + 1]
-        return "Unknown"
+        try:
+            i = parts.index("objects")
+        except ValueError:
+            return "Unknown"
+        return parts[i + 1] if i + 1 < len(parts) else "Unknown"
 
     def _analyze_formula(self, formula: str) -> dict:
         """Analyze a validation rule formula for structural patterns."""
@@ -94,47 +117,31 @@ class ValidationRuleExtractor(BaseExtractor):
             "operators": [],
         }
 
-        # Detect formula functions
-        sf_functions = [
-            "AND", "OR", "NOT", "IF", "CASE", "ISBLANK", "ISNULL",
-            "ISPICKVAL", "ISCHANGED", "ISNEW", "PRIORVALUE",
-            "TEXT", "VALUE", "LEN", "LEFT", "RIGHT", "MID",
-            "CONTAINS", "BEGINS", "INCLUDES",
-            "TODAY", "NOW", "DATEVALUE", "DATETIMEVALUE",
-            "YEAR", "MONTH", "DAY",
-            "REGEX", "SUBSTITUTE", "TRIM",
-            "NULLVALUE", "BLANKVALUE",
-            "HYPERLINK", "IMAGE",
-        ]
+        # Detect formula functions. These are substring probes, so TODAY(
+        # also counts as DAY( and XOR( as OR(.
         formula_upper = formula.upper()
-        for func in sf_functions:
-            if func + "(" in formula_upper:
-                analysis["functions_used"].append(func)
+        analysis["functions_used"] = [
+            func for func, probe in _SF_FUNCTION_PROBES if probe in formula_upper
+        ]
 
         # Count conditions (AND/OR branches)
         analysis["condition_count"] = (
             formula_upper.count("AND(") + formula_upper.count("OR(") + 1
         )
 
-        # Nesting depth
+        # Special references
+        analysis["uses_permissions"] = "$Permission" in formula
+        analysis["uses_record_type"] = "RecordType" in formula
+        analysis["uses_profile"] = "$Profile" in formula or "$UserRole" in formula
+
+        # Nesting depth: strip the formula down to its parentheses, then
+        # take the peak of the running +1/-1 sum without a per-char loop
         max_depth = 0
-        current_depth = 0
-        for char in formula:
-            if char == "(":
-                current_depth += 1
-                max_depth = max(max_depth, current_depth)
-            elif char == ")":
-                current_depth -= 1
+        if "(" in formula:
+            parens = _NON_PAREN_RE.sub("", formula)
+            max_depth = max(accumulate(map(_PAREN_STEP.__getitem__, parens), initial=0))
         analysis["nesting_depth"] = max_depth
 
-        # Special references
-        if "$Permission" in formula:
-            analysis["uses_permissions"] = True
-        if "$RecordType" in formula or "RecordType" in formula:
-            analysis["uses_record_type"] = True
-        if "$Profile" in formula or "$UserRole" in formula:
-            analysis["uses_profile"] = True
-
         return analysis
 
     def _genericize_name(self, name: str) -> str:
@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
-import hashlib
+import json
 import logging
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable
-
-from .anonymizer import anonymize_field_name, configure_scrubber, get_scrubber
-from .base import ExtractedPattern
+from typing import Callable, Iterable, Iterator
+
+from .anonymizer import (
+    anonymize_field_name,
+    configure_scrubber,
+    get_scrubber,
+    set_scrubber,
+)
+from .base import BaseExtractor, ExtractedPattern, source_hash_for
 from .parsers.apex_parser import ApexExtractor
 from .parsers.flow_parser import FlowExtractor
 from .parsers.layout_parser import LayoutExtractor
@@ -18,6 +28,12 @@ from .parsers.object_parser import ObjectExtractor
 from .parsers.report_parser import ReportExtractor
 from .parsers.validation_parser import ValidationRuleExtractor
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,24 +76,49 @@ _FILE_PATTERNS = {
     ".layout-meta.xml": "layout",
 }
 
+# The suffixes above as one end-anchored alternation; the captured kind
+# ("flow", "validationRule", ...) maps back to the file type
+_SUFFIX_TYPE = {
+    suffix.removeprefix(".").removesuffix("-meta.xml"): file_type
+    for suffix, file_type in _FILE_PATTERNS.items()
+}
+_SUFFIX_RE = re.compile(r"\.(" + "|".join(_SUFFIX_TYPE) + r")-meta\.xml\Z")
+
+# Below this many files, spawning a pool costs more than it saves
+_MIN_POOL_FILES = 200
+
+# Minimum seconds between progress callbacks while scanning (at most 20Hz)
+_PROGRESS_INTERVAL = 0.05
 
-def _classify_file(file_path: Path) -> str | None:
-    """Determine what kind of metadata file this is."""
-    name = file_path.name
+_LWC_DIR = f"{os.sep}lwc{os.sep}"
+_CLASSES_DIR = f"{os.sep}classes{os.sep}"
+_OBJECTS_DIR = f"{os.sep}objects{os.sep}"
 
-    for suffix, file_type in _FILE_PATTERNS.items():
-        if name.endswith(suffix):
-            return file_type
+
+def _classify_file_str(path_str: str, name: str) -> str | None:
+    """Determine what kind of metadata file this is.
+
+    Works on the raw path string and file name, so discovery doesn't build
+    a Path (or its parts tuple) for the many files it skips.
+    """
+    # The extension alone rules out most files: every metadata suffix
+    # ends in .xml, and only .js and .cls files need a directory check
+    dot = name.rfind(".")
+    ext = name[dot + 1:] if dot >= 0 else ""
+    if ext == "xml":
+        match = _SUFFIX_RE.search(name)
+        return _SUFFIX_TYPE[match.group(1)] if match else None
+    if dot <= 0:
+        return None
 
     # LWC: .js files inside lwc/ directories
-    if file_path.suffix == ".js" and "lwc" in file_path.parts:
+    if ext == "js" and (_LWC_DIR in path_str or path_str.startswith(_LWC_DIR[1:])):
         # Only the main component JS file, not helpers
-        parent_name = file_path.parent.name
-        if file_path.stem == parent_name:
+        if path_str.rsplit(os.sep, 2)[-2] == name[:dot]:
             return "lwc"
 
     # Apex classes
-    if file_path.suffix == ".cls" and "classes" in file_path.parts:
+    elif ext == "cls" and (_CLASSES_DIR in path_str or path_str.startswith(_CLASSES_DIR[1:])):
         return "apex"
 
     return None
@@ -87,6 +128,7 @@ def scan_sfdx_project(
     project_path: str | Path,
     progress_callback: Callable[[ScanProgress], None] | None = None,
     custom_brand_terms: list[str] | None = None,
+    workers: int = 1,
 ) -> ScanResult:
     """Scan an SFDX project directory and extract all patterns.
 
@@ -94,13 +136,15 @@ def scan_sfdx_project(
         project_path: Path to the SFDX project root (containing sfdx-project.json
                       or force-app directory)
         progress_callback: Optional callback for real-time progress updates
+        workers: Number of processes to extract with; 1 extracts in-process,
+                 as do projects under _MIN_POOL_FILES files
 
     Returns:
         ScanResult with all extracted patterns
     """
     project_path = Path(project_path)
     source_id = project_path.name
-    source_hash = hashlib.sha256(source_id.encode()).hexdigest()[:12]
+    source_hash = source_hash_for(source_id)
 
     progress = ScanProgress()
 
@@ -116,28 +160,26 @@ def scan_sfdx_project(
             progress=progress,
         )
 
-    # Discover all metadata files
-    all_files = _discover_files(force_app)
-    progress.total_files = len(all_files)
-
-    if progress_callback:
-        progress_callback(progress)
-
-    # ── Brand detection phase ──
-    # Collect all custom field names for auto-detection
+    # Discover all metadata files, collecting custom field names for
+    # brand auto-detection in the same pass
+    all_files: list[tuple[Path, str]] = []
     field_names = []
-    for file_path, file_type in all_files:
+    for file_path, file_type in _discover_files(force_app):
+        all_files.append((file_path, file_type))
         if file_type == "field":
             # Extract field name from path: objects/Obj/fields/FieldName.field-meta.xml
             field_stem = file_path.stem.replace(".field-meta", "")
-            parts = file_path.parts
-            for i, part in enumerate(parts):
-                if part == "objects" and i + 1 < len(parts):
-                    field_names.append(f"{parts[i + 1]}.{field_stem}")
-                    break
+            obj_name = _object_dir_name(os.fspath(file_path))
+            if obj_name is not None:
+                field_names.append(f"{obj_name}.{field_stem}")
             else:
                 field_names.append(field_stem)
+    progress.total_files = len(all_files)
 
+    if progress_callback:
+        progress_callback(progress)
+
+    # ── Brand detection phase ──
     scrubber = configure_scrubber(
         org_name=source_id,
         custom_terms=custom_brand_terms,
@@ -147,54 +189,62 @@ def scan_sfdx_project(
     if detected:
         logger.info(f"Auto-detected {len(detected)} brand terms to scrub: {detected[:10]}")
 
-    # Initialize extractors
-    extractors = {
-        "flow": FlowExtractor(source_id),
-        "validation": ValidationRuleExtractor(source_id),
-        "object": ObjectExtractor(source_id),
-        "field": ObjectExtractor(source_id),
-        "report": ReportExtractor(source_id),
-        "layout": LayoutExtractor(source_id),
-        "lwc": LWCExtractor(source_id),
-        "apex": ApexExtractor(source_id),
-    }
-
-    all_patterns: list[ExtractedPattern] = []
-
-    for file_path, file_type in all_files:
-        progress.current_file = str(file_path.relative_to(project_path))
-        progress.processed_files += 1
-
-        # Track metadata type counts
-        progress.metadata_counts[file_type] = (
-            progress.metadata_counts.get(file_type, 0) + 1
+    if workers > 1 and len(all_files) >= _MIN_POOL_FILES:
+        # Spawned workers don't inherit module state, so hand them the
+        # configured scrubber explicitly.
+        workers = min(workers, len(all_files))
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(source_id, scrubber),
+        )
+        results: Iterable[tuple[list[ExtractedPattern], str | None]] = pool.map(
+            _extract_in_worker, all_files, chunksize=_chunksize(len(all_files), workers),
+        )
+    else:
+        pool = None
+        extractors = _build_extractors(source_id)
+        results = (
+            _extract_file(extractors, file_path, file_type)
+            for file_path, file_type in all_files
         )
 
-        extractor = extractors.get(file_type)
-        if extractor is None:
-            continue
-
-        try:
-            patterns = extractor.extract(file_path)
-            all_patterns.extend(patterns)
-            progress.patterns_found += len(patterns)
-        except Exception as e:
-            error_msg = f"Error parsing {file_path.name}: {e}"
-            progress.errors.append(error_msg)
-            logger.warning(error_msg)
-
-        if progress_callback and progress.processed_files % 50 == 0:
-            progress_callback(progress)
-
-    # ── Post-processing: scrub brand terms from names and field refs ──
-    scrubber = get_scrubber()
-    if scrubber:
-        for p in all_patterns:
-            p.name = scrubber.scrub(p.name)
-            p.description = scrubber.scrub(p.description)
-            p.source_object = scrubber.scrub(p.source_object)
-            p.field_references = [scrubber.scrub(f) for f in p.field_references]
-            p.tags = [scrubber.scrub(t) for t in p.tags]
+    all_patterns: list[ExtractedPattern] = []
+    next_callback = time.monotonic() + _PROGRESS_INTERVAL
+    # Discovered paths all start with this, so the current file's relative
+    # path is a prefix strip, done only when progress is reported
+    project_prefix = os.path.join(os.fspath(project_path), "")
+    file_path = None
+
+    try:
+        for (file_path, file_type), (patterns, error_msg) in zip(all_files, results):
+            progress.processed_files += 1
+
+            # Track metadata type counts
+            progress.metadata_counts[file_type] = (
+                progress.metadata_counts.get(file_type, 0) + 1
+            )
+
+            if error_msg:
+                progress.errors.append(error_msg)
+                logger.warning(error_msg)
+            else:
+                all_patterns.extend(patterns)
+                progress.patterns_found += len(patterns)
+
+            if progress_callback:
+                now = time.monotonic()
+                if now >= next_callback:
+                    progress.current_file = os.fspath(file_path).removeprefix(project_prefix)
+                    progress_callback(progress)
+                    next_callback = now + _PROGRESS_INTERVAL
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if file_path is not None:
+        progress.current_file = os.fspath(file_path).removeprefix(project_prefix)
 
     # Final callback
     if progress_callback:
@@ -209,12 +259,130 @@ def scan_sfdx_project(
     )
 
 
+def _object_dir_name(path_str: str) -> str | None:
+    """Name of the entry right below the first objects/ directory in a path."""
+    if path_str.startswith(_OBJECTS_DIR[1:]):
+        start = len(_OBJECTS_DIR) - 1
+    else:
+        idx = path_str.find(_OBJECTS_DIR)
+        if idx < 0:
+            return None
+        start = idx + len(_OBJECTS_DIR)
+    end = path_str.find(os.sep, start)
+    return path_str[start:end] if end >= 0 else path_str[start:]
+
+
+# Extractor class per file type. Object and field files share one instance.
+_EXTRACTOR_CLASSES: dict[str, type[BaseExtractor]] = {
+    "flow": FlowExtractor,
+    "validation": ValidationRuleExtractor,
+    "object": ObjectExtractor,
+    "report": ReportExtractor,
+    "layout": LayoutExtractor,
+    "lwc": LWCExtractor,
+    "apex": ApexExtractor,
+}
+_EXTRACTOR_ALIASES = {"field": "object"}
+
+
+class _Extractors(dict):
+    """Extractors by file type, each created the first time it is needed."""
+
+    def __init__(self, source_id: str) -> None:
+        super().__init__()
+        self.source_id = source_id
+
+    def __missing__(self, file_type: str) -> BaseExtractor:
+        alias = _EXTRACTOR_ALIASES.get(file_type)
+        if alias is not None:
+            extractor = self[alias]
+        else:
+            extractor = _EXTRACTOR_CLASSES[file_type](self.source_id)
+        self[file_type] = extractor
+        return extractor
+
+
+def _build_extractors(source_id: str) -> dict[str, BaseExtractor]:
+    """Create the per-file-type extractor lookup for one scan."""
+    return _Extractors(source_id)
+
+
+def _extract_file(
+    extractors: dict[str, BaseExtractor],
+    file_path: Path,
+    file_type: str,
+) -> tuple[list[ExtractedPattern], str | None]:
+    """Run the matching extractor on one file.
+
+    Returns (patterns, error message); errors are reported rather than
+    raised so one bad file never aborts a batch.
+    """
+    try:
+        extractor = extractors[file_type]
+    except KeyError:
+        return [], None
+
+    try:
+        patterns = extractor.extract(file_path)
+    except Exception as e:
+        return [], f"Error parsing {file_path.name}: {e}"
+
+    _scrub_patterns(patterns)
+    return patterns, None
+
+
+def _scrub_patterns(patterns: list[ExtractedPattern]) -> None:
+    """Scrub brand terms from the names and field refs of new patterns.
+
+    Runs per file, next to extraction, so pool workers scrub their own
+    output in parallel instead of the parent doing it all at the end.
+    """
+    scrubber = get_scrubber()
+    scrub = scrubber.substituter() if scrubber is not None else None
+    if scrub is None:
+        return
+    for p in patterns:
+        p.name = scrub(p.name)
+        p.description = scrub(p.description)
+        p.source_object = scrub(p.source_object)
+        p.field_references = list(map(scrub, p.field_references))
+        p.tags = list(map(scrub, p.tags))
+
+
+def _chunksize(file_count: int, workers: int) -> int:
+    """Number of files handed to a pool worker per task.
+
+    Up to 64 amortizes IPC over small metadata files, while leaving each
+    worker about four batches so uneven files still balance out.
+    """
+    return max(1, min(64, file_count // (workers * 4)))
+
+
+# Per-process extractors, set up by _init_worker in pool workers
+_worker_extractors: dict[str, BaseExtractor] = {}
+
+
+def _init_worker(source_id: str, scrubber) -> None:
+    """Pool initializer: mirror the parent's scrubber and build extractors."""
+    global _worker_extractors
+    set_scrubber(scrubber)
+    _worker_extractors = _build_extractors(source_id)
+
+
+def _extract_in_worker(
+    item: tuple[Path, str],
+) -> tuple[list[ExtractedPattern], str | None]:
+    file_path, file_type = item
+    return _extract_file(_worker_extractors, file_path, file_type)
+
+
 def _find_force_app(project_path: Path) -> Path | None:
     """Find the force-app directory in an SFDX project."""
-    # Direct force-app child
-    direct = project_path / "force-app"
-    if direct.is_dir():
-        return direct
+    # Direct force-app child, the common case: checked on strings so no
+    # Path is built unless it exists
+    direct = os.path.join(project_path, "force-app")
+    if os.path.isdir(direct):
+        return Path(direct)
 
     # Check if the path itself is a force-app
     if project_path.name == "force-app":
@@ -224,31 +392,53 @@ def _find_force_app(project_path: Path) -> Path | None:
     sfdx_config = project_path / "sfdx-project.json"
     if sfdx_config.exists():
         try:
-            import json
-            config = json.loads(sfdx_config.read_text())
+            config = _load_json(sfdx_config.read_bytes())
             for pkg in config.get("packageDirectories", []):
                 pkg_path = project_path / pkg.get("path", "")
                 if pkg_path.is_dir():
                     return pkg_path
-        except (json.JSONDecodeError, OSError):
+        except (ValueError, OSError):
             pass
 
     return None
 
 
-def _discover_files(force_app: Path) -> list[tuple[Path, str]]:
-    """Discover all parseable metadata files under force-app."""
-    files: list[tuple[Path, str]] = []
+def _load_json(data: bytes):
+    """Parse JSON bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # stdlib json also takes a BOM, NaN and arbitrarily large ints
+            pass
+    return json.loads(data)
 
-    for file_path in force_app.rglob("*"):
-        if not file_path.is_file():
-            continue
 
-        file_type = _classify_file(file_path)
-        if file_type is not None:
-            files.append((file_path, file_type))
+def _discover_files(force_app: Path) -> Iterator[tuple[Path, str]]:
+    """Yield all parseable metadata files under force-app.
+
+    Walks with os.scandir, whose entries answer is_file()/is_dir() from the
+    directory listing instead of a stat per path. Order matches rglob("*"):
+    a directory's files, then its subdirectories depth-first, and symlinked
+    directories are not followed. Files are yielded as they are found, so
+    callers that stream don't need the whole list.
+    """
+    stack = [os.fspath(force_app)]
 
-    return files
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        file_type = _classify_file_str(entry.path, entry.name)
+                        if file_type is not None:
+                            yield Path(entry.path), file_type
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
 
 
 def list_sfdx_projects(base_path: str | Path) -> list[dict]:
@@ -262,18 +452,22 @@ def list_sfdx_projects(base_path: str | Path) -> list[dict]:
     if not base.is_dir():
         return projects
 
-    for child in sorted(base.iterdir()):
-        if not child.is_dir():
-            continue
+    # One scandir listing; entries cache their type, and only the directory
+    # entries that look like projects become dict rows
+    with os.scandir(base) as entries:
+        children = [entry for entry in entries if entry.is_dir()]
+    # Same order as sorting the Paths (case-insensitive on Windows)
+    children.sort(key=lambda entry: os.path.normcase(entry.name))
 
+    for child in children:
         # Check if it's an SFDX project
-        has_sfdx = (child / "sfdx-project.json").exists()
-        has_force_app = (child / "force-app").is_dir()
+        has_sfdx = os.path.exists(os.path.join(child.path, "sfdx-project.json"))
+        has_force_app = os.path.isdir(os.path.join(child.path, "force-app"))
 
         if has_sfdx or has_force_app:
             projects.append({
                 "name": child.name,
-                "path": str(child),
+                "path": child.path,
                 "has_sfdx_config": has_sfdx,
                 "has_force_app": has_force_app,
             })
@@ -16,8 +16,15 @@ Configure in Claude Code:
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import json
+import re
 import sys
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 
 from mcp.server import Server
@@ -33,18 +40,58 @@ from blackboxaf.db.database import get_session_factory, init_db
 from blackboxaf.db.models import Pattern, Source
 from blackboxaf.config import CATEGORY_COLORS
 
-from sqlalchemy import func, text
+from sqlalchemy import column, func, or_, select, text, update
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 # ── Server Setup ──
 
 server = Server("blackboxaf")
 
+# Engine and session factory, created on first use and shared by every
+# tool call so sessions check connections out of one pool
+_engine = None
+_session_factory = None
+_session_lock = threading.Lock()
+
+# Seconds a cached search or stats result may be served for. The vault is
+# written by the web app's ingest, usually in another process, so entries
+# age out instead of being invalidated; clear with the cache_clear() of
+# _search_cached, _categories_text and _vault_stats_text.
+_CACHE_TTL = 60
+
+# Result count a search returns when the caller gives none, and the most
+# it returns whatever the caller asks for
+_SEARCH_LIMIT_DEFAULT = 10
+_SEARCH_LIMIT_MAX = 100
+
+_FTS_IDS_SQL = "SELECT row_id FROM patterns_fts WHERE patterns_fts MATCH :q"
+
+
+def _fts_ids(match: str):
+    """Subquery of the pattern ids whose FTS row matches ``match``."""
+    return text(_FTS_IDS_SQL).bindparams(q=match).columns(column("row_id"))
+
+
+def _fts_has_match(session, match: str) -> bool:
+    """Whether any pattern matches ``match``, fetching at most one id."""
+    return session.execute(text(_FTS_IDS_SQL + " LIMIT 1"), {"q": match}).first() is not None
+
+
 def _get_session():
     """Get a database session."""
-    engine = init_db()
-    factory = get_session_factory(engine)
-    return factory()
+    global _engine, _session_factory
+    if _session_factory is None:
+        with _session_lock:
+            if _session_factory is None:
+                _engine = init_db()
+                _session_factory = get_session_factory(_engine)
+    return _session_factory()
 
 
 # ── Tool Definitions ──
@@ -212,107 +259,155 @@ async def list_tools() -> list[Tool]:
 
 # ── Tool Implementations ──
 
+# Handlers do blocking SQLite work, so each runs in a worker thread and
+# the event loop stays free for other requests meanwhile
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     if name == "search_patterns":
-        return await _search_patterns(arguments)
+        return await asyncio.to_thread(_search_patterns, arguments)
     elif name == "get_pattern":
-        return await _get_pattern(arguments)
+        return await asyncio.to_thread(_get_pattern, arguments)
     elif name == "list_categories":
-        return await _list_categories(arguments)
+        return await asyncio.to_thread(_list_categories, arguments)
     elif name == "get_vault_stats":
-        return await _get_vault_stats(arguments)
+        return await asyncio.to_thread(_get_vault_stats, arguments)
     elif name == "compose_solution":
-        return await _compose_solution(arguments)
+        return await asyncio.to_thread(_compose_solution, arguments)
     elif name == "generate_field_mapping":
-        return await _generate_field_mapping(arguments)
+        return await asyncio.to_thread(_generate_field_mapping, arguments)
     else:
         return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
 
-async def _search_patterns(args: dict) -> list[TextContent]:
+def _search_patterns(args: dict) -> list[TextContent]:
     """Search patterns with filters and FTS."""
-    query_text = args.get("query", "")
-    category = args.get("category")
-    pattern_type = args.get("pattern_type")
-    source_object = args.get("source_object")
-    min_complexity = args.get("min_complexity")
-    max_complexity = args.get("max_complexity")
-    limit = args.get("limit", 10)
-
+    # Tool arguments are arbitrary JSON; coerce them to the scalar types
+    # _search_cached expects so they are always hashable cache keys
+    limit = _optional_int(args.get("limit")) or _SEARCH_LIMIT_DEFAULT
+    output = _search_cached(
+        int(time.monotonic() // _CACHE_TTL),
+        str(args.get("query") or ""),
+        _optional_str(args.get("category")),
+        _optional_str(args.get("pattern_type")),
+        _optional_str(args.get("source_object")),
+        _optional_int(args.get("min_complexity")),
+        _optional_int(args.get("max_complexity")),
+        min(max(limit, 1), _SEARCH_LIMIT_MAX),
+    )
+    return [TextContent(type="text", text=output)]
+
+
+def _optional_str(value) -> str | None:
+    return None if value is None else str(value)
+
+
+def _optional_int(value) -> int | None:
+    """An integer argument, or None when it is missing or not a number."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+@lru_cache(maxsize=512)
+def _search_cached(
+    time_bucket: int,
+    query_text: str,
+    category: str | None,
+    pattern_type: str | None,
+    source_object: str | None,
+    min_complexity: int | None,
+    max_complexity: int | None,
+    limit: int,
+) -> str:
+    """Run a search and format its output; memoized on the arguments.
+
+    ``time_bucket`` changes every _CACHE_TTL seconds, so a repeated
+    search only reuses a result from the same window.
+    """
     session = _get_session()
     try:
-        query = session.query(Pattern)
+        # Only the listed columns are read, so select them as plain rows
+        # rather than hydrating Pattern objects; the window count rides
+        # along with the page, so the filters and the FTS id list are
+        # evaluated once rather than again for a count()
+        query = select(
+            Pattern.id,
+            Pattern.name,
+            Pattern.category,
+            Pattern.pattern_type,
+            Pattern.source_object,
+            Pattern.complexity_score,
+            Pattern.description,
+            Pattern.tags,
+            func.count().over().label("total"),
+        )
 
         if category:
-            query = query.filter(Pattern.category == category)
+            query = query.where(Pattern.category == category)
         if pattern_type:
-            query = query.filter(Pattern.pattern_type == pattern_type)
+            query = query.where(Pattern.pattern_type == pattern_type)
         if source_object:
-            query = query.filter(Pattern.source_object == source_object)
+            query = query.where(Pattern.source_object == source_object)
         if min_complexity is not None:
-            query = query.filter(Pattern.complexity_score >= min_complexity)
+            query = query.where(Pattern.complexity_score >= min_complexity)
         if max_complexity is not None:
-            query = query.filter(Pattern.complexity_score <= max_complexity)
+            query = query.where(Pattern.complexity_score <= max_complexity)
 
-        # Full-text search
+        # Full-text search. The match goes into the query as a subquery, so
+        # ids never round-trip through Python or a bound IN list; a LIMIT 1
+        # probe picks which form of the match to use.
         if query_text:
-            fts_ids = session.execute(
-                text("SELECT row_id FROM patterns_fts WHERE patterns_fts MATCH :q"),
-                {"q": query_text},
-            ).fetchall()
-            matching_ids = [row[0] for row in fts_ids]
-
-            if matching_ids:
-                query = query.filter(Pattern.id.in_(matching_ids))
+            fts_q = query_text
+            if not _fts_has_match(session, fts_q):
+                # Relax to any word as a prefix ("acc" finds "Account"),
+                # still on the FTS index rather than a LIKE table scan
+                fts_q = " OR ".join(
+                    '"' + token.replace('"', '""') + '"*' for token in query_text.split()
+                )
+                if fts_q and not _fts_has_match(session, fts_q):
+                    fts_q = ""
+
+            if fts_q:
+                query = query.where(Pattern.id.in_(_fts_ids(fts_q)))
             else:
                 like_q = f"%{query_text}%"
-                query = query.filter(
+                query = query.where(
                     (Pattern.name.ilike(like_q))
                     | (Pattern.description.ilike(like_q))
                     | (Pattern.source_object.ilike(like_q))
                     | (Pattern.tags.ilike(like_q))
                 )
 
-        total = query.count()
-        patterns = (
-            query.order_by(Pattern.complexity_score.desc(), Pattern.name)
-            .limit(limit)
-            .all()
-        )
-
-        results = []
-        for p in patterns:
-            results.append({
-                "id": p.id,
-                "name": p.name,
-                "category": p.category,
-                "pattern_type": p.pattern_type,
-                "source_object": p.source_object,
-                "complexity": p.complexity_score,
-                "description": p.description[:200] if p.description else "",
-                "tags": p.get_tags()[:8],
-            })
-
-        output = f"Found {total} patterns (showing {len(results)}):\n\n"
-        for r in results:
-            output += (
-                f"  [{r['id']}] {r['name']}\n"
-                f"      Category: {r['category']} | Type: {r['pattern_type']}\n"
-                f"      Object: {r['source_object']} | Complexity: {'*' * r['complexity']}\n"
-                f"      {r['description']}\n"
-                f"      Tags: {', '.join(r['tags'])}\n\n"
+        rows = session.execute(
+            query.order_by(Pattern.complexity_score.desc(), Pattern.name).limit(limit)
+        ).all()
+        total = rows[0].total if rows else 0
+
+        if not rows:
+            return f"No patterns found matching '{query_text}'. Try broader keywords or different filters."
+
+        # Format each row as it is read, with no intermediate dict per row
+        parts = [f"Found {total} patterns (showing {len(rows)}):\n\n"]
+        for row in rows:
+            description = row.description[:200] if row.description else ""
+            tags = Pattern.parse_tags(row.tags)[:8]
+            parts.append(
+                f"  [{row.id}] {row.name}\n"
+                f"      Category: {row.category} | Type: {row.pattern_type}\n"
+                f"      Object: {row.source_object} | Complexity: {'*' * row.complexity_score}\n"
+                f"      {description}\n"
+                f"      Tags: {', '.join(tags)}\n\n"
             )
 
-        if not results:
-            output = f"No patterns found matching '{query_text}'. Try broader keywords or different filters."
-
-        return [TextContent(type="text", text=output)]
+        return "".join(parts)
     finally:
         session.close()
 
 
-async def _get_pattern(args: dict) -> list[TextContent]:
+def _get_pattern(args: dict) -> list[TextContent]:
     """Get full pattern detail."""
     pattern_id = args.get("pattern_id")
 
@@ -334,13 +429,17 @@ async def _get_pattern(args: dict) -> list[TextContent]:
             f"Source File: {data['source_file']}\n"
             f"Uses:        {data['use_count']}\n"
             f"\nDescription:\n{data['description']}\n"
-            f"\nField References:\n{json.dumps(data['field_references'], indent=2)}\n"
+            f"\nField References:\n{_dump_json(data['field_references'])}\n"
             f"\nTags: {', '.join(data['tags'])}\n"
-            f"\nStructure (JSON):\n{json.dumps(data['structure'], indent=2)}\n"
+            f"\nStructure (JSON):\n{_dump_json(data['structure'])}\n"
         )
 
-        # Increment use count
-        pattern.use_count += 1
+        # Increment use count in SQL, so the commit flushes no ORM state
+        session.execute(
+            update(Pattern)
+            .where(Pattern.id == pattern.id)
+            .values(use_count=Pattern.use_count + 1)
+        )
         session.commit()
 
         return [TextContent(type="text", text=output)]
@@ -348,88 +447,102 @@ async def _get_pattern(args: dict) -> list[TextContent]:
         session.close()
 
 
-async def _list_categories(args: dict) -> list[TextContent]:
+def _list_categories(args: dict) -> list[TextContent]:
     """List categories with counts."""
+    output = _categories_text(int(time.monotonic() // _CACHE_TTL))
+    return [TextContent(type="text", text=output)]
+
+
+@lru_cache(maxsize=1)
+def _categories_text(time_bucket: int) -> str:
+    """Category and pattern type counts, reused within one time bucket."""
     session = _get_session()
     try:
-        results = (
-            session.query(Pattern.category, func.count(Pattern.id))
+        results = session.execute(
+            select(Pattern.category, func.count(Pattern.id))
             .group_by(Pattern.category)
             .order_by(func.count(Pattern.id).desc())
-            .all()
-        )
+        ).all()
 
         total = sum(c for _, c in results)
-        output = f"BlackBoxAF Pattern Vault - {total} total patterns\n\n"
-        output += "Categories:\n"
+        parts = [f"BlackBoxAF Pattern Vault - {total} total patterns\n\n"]
+        parts.append("Categories:\n")
         for cat, count in results:
             color = CATEGORY_COLORS.get(cat, "#888")
-            output += f"  {cat}: {count} patterns ({color})\n"
+            parts.append(f"  {cat}: {count} patterns ({color})\n")
 
         # Also show pattern types
-        types = (
-            session.query(Pattern.pattern_type, func.count(Pattern.id))
+        types = session.execute(
+            select(Pattern.pattern_type, func.count(Pattern.id))
             .group_by(Pattern.pattern_type)
             .order_by(func.count(Pattern.id).desc())
-            .all()
-        )
-        output += "\nPattern Types:\n"
+        ).all()
+        parts.append("\nPattern Types:\n")
         for ptype, count in types:
-            output += f"  {ptype}: {count}\n"
+            parts.append(f"  {ptype}: {count}\n")
 
-        return [TextContent(type="text", text=output)]
+        return "".join(parts)
     finally:
         session.close()
 
 
-async def _get_vault_stats(args: dict) -> list[TextContent]:
+def _get_vault_stats(args: dict) -> list[TextContent]:
     """Get vault statistics."""
+    output = _vault_stats_text(int(time.monotonic() // _CACHE_TTL))
+    return [TextContent(type="text", text=output)]
+
+
+@lru_cache(maxsize=1)
+def _vault_stats_text(time_bucket: int) -> str:
+    """Vault statistics, reused within one time bucket."""
     session = _get_session()
     try:
-        total = session.query(Pattern).count()
+        total = session.scalar(select(func.count()).select_from(Pattern))
 
-        by_category = (
-            session.query(Pattern.category, func.count(Pattern.id))
-            .group_by(Pattern.category).all()
-        )
-        by_object = (
-            session.query(Pattern.source_object, func.count(Pattern.id))
+        by_category = session.execute(
+            select(Pattern.category, func.count(Pattern.id))
+            .group_by(Pattern.category)
+        ).all()
+        by_object = session.execute(
+            select(Pattern.source_object, func.count(Pattern.id))
             .group_by(Pattern.source_object)
             .order_by(func.count(Pattern.id).desc())
-            .limit(15).all()
-        )
-        by_complexity = (
-            session.query(Pattern.complexity_score, func.count(Pattern.id))
-            .group_by(Pattern.complexity_score).all()
-        )
-        sources = session.query(Source).all()
-
-        output = f"BlackBoxAF Vault Statistics\n{'=' * 40}\n"
-        output += f"Total Patterns: {total}\n\n"
-
-        output += "By Category:\n"
+            .limit(15)
+        ).all()
+        by_complexity = session.execute(
+            select(Pattern.complexity_score, func.count(Pattern.id))
+            .group_by(Pattern.complexity_score)
+        ).all()
+        sources = session.execute(
+            select(Source.display_name, Source.pattern_count)
+        ).all()
+
+        parts = [f"BlackBoxAF Vault Statistics\n{'=' * 40}\n"]
+        parts.append(f"Total Patterns: {total}\n\n")
+
+        parts.append("By Category:\n")
         for cat, count in by_category:
-            output += f"  {cat}: {count}\n"
+            parts.append(f"  {cat}: {count}\n")
 
-        output += "\nTop Objects:\n"
+        parts.append("\nTop Objects:\n")
         for obj, count in by_object:
-            output += f"  {obj}: {count}\n"
+            parts.append(f"  {obj}: {count}\n")
 
-        output += "\nComplexity Distribution:\n"
+        parts.append("\nComplexity Distribution:\n")
         for score, count in sorted(by_complexity):
             label = ["", "Basic", "Simple", "Moderate", "Complex", "Expert"][min(score, 5)]
-            output += f"  {score} ({label}): {count}\n"
+            parts.append(f"  {score} ({label}): {count}\n")
 
-        output += f"\nIngested Sources: {len(sources)}\n"
+        parts.append(f"\nIngested Sources: {len(sources)}\n")
         for s in sources:
-            output += f"  {s.display_name}: {s.pattern_count} patterns\n"
+            parts.append(f"  {s.display_name}: {s.pattern_count} patterns\n")
 
-        return [TextContent(type="text", text=output)]
+        return "".join(parts)
     finally:
         session.close()
 
 
-async def _compose_solution(args: dict) -> list[TextContent]:
+def _compose_solution(args: dict) -> list[TextContent]:
     """Agentforce-style: compose a multi-component solution from patterns."""
     requirement = args.get("requirement", "")
     target_object = args.get("target_object", "")
@@ -455,62 +568,78 @@ async def _compose_solution(args: dict) -> list[TextContent]:
         if include_layouts:
             category_map.append(("Page Layout", "Page Layouts"))
 
-        for category, label in category_map:
-            query = session.query(Pattern).filter(Pattern.category == category)
-
-            # Filter by target object if possible
-            object_patterns = query.filter(
-                Pattern.source_object.ilike(f"%{target_object}%")
+        # One FTS match for all keywords, each as a prefix, shared by
+        # every category below instead of a LIKE scan per keyword
+        fts_query = " OR ".join('"' + kw.replace('"', '""') + '"*' for kw in keywords)
+
+        # One query over every enabled category: rows matching the target
+        # object or a keyword, flagged by which, then bucketed per category.
+        # Only the 5 most complex of each (category, flag) group can make a
+        # category's top 5, so those are ranked and cut in SQL before any
+        # full row is loaded.
+        object_hits = defaultdict(list)
+        keyword_hits = defaultdict(list)
+        if category_map:
+            # Object names are exact, so try a case-insensitive equality the
+            # NOCASE index can seek on; fall back to substring matching only
+            # when no pattern has that object at all
+            object_match = Pattern.source_object.collate("NOCASE") == target_object
+            if session.execute(select(Pattern.id).where(object_match).limit(1)).first() is None:
+                object_match = Pattern.source_object.ilike(f"%{target_object}%")
+            matches = or_(object_match, Pattern.id.in_(_fts_ids(fts_query))) if fts_query else object_match
+            candidates = (
+                select(
+                    Pattern.id,
+                    object_match.label("object_match"),
+                    func.row_number().over(
+                        partition_by=(Pattern.category, object_match),
+                        order_by=(Pattern.complexity_score.desc(), Pattern.id),
+                    ).label("rank"),
+                )
+                .where(Pattern.category.in_([category for category, _ in category_map]), matches)
+                .subquery()
+            )
+            rows = session.execute(
+                select(Pattern, candidates.c.object_match)
+                .join(candidates, Pattern.id == candidates.c.id)
+                .where(candidates.c.rank <= 5)
+                .order_by(Pattern.id)
             ).all()
+            for p, is_object_match in rows:
+                hits = object_hits if is_object_match else keyword_hits
+                hits[p.category].append(p)
 
-            # Also search by keywords across all objects in this category
-            keyword_patterns = []
-            for kw in keywords:
-                like_kw = f"%{kw}%"
-                kw_results = query.filter(
-                    (Pattern.name.ilike(like_kw))
-                    | (Pattern.description.ilike(like_kw))
-                    | (Pattern.tags.ilike(like_kw))
-                ).limit(5).all()
-                keyword_patterns.extend(kw_results)
-
-            # Deduplicate and rank
-            seen_ids = set()
-            ranked = []
-            for p in object_patterns + keyword_patterns:
-                if p.id not in seen_ids:
-                    seen_ids.add(p.id)
-                    ranked.append(p)
-
-            # Sort by complexity (most complete first) and take top 5
-            ranked.sort(key=lambda p: p.complexity_score, reverse=True)
-            solution_components[label] = ranked[:5]
+        for category, label in category_map:
+            # Target-object matches rank ahead of keyword matches; take the
+            # top 5 by complexity (most complete first), ties in that order
+            ranked = object_hits[category] + keyword_hits[category]
+            solution_components[label] = heapq.nlargest(5, ranked, key=lambda p: p.complexity_score)
 
         # Build solution output
-        output = (
+        parts = [
             f"Solution Blueprint: {requirement}\n"
             f"{'=' * 60}\n"
             f"Target Object: {target_object}\n"
             f"Keywords: {', '.join(keywords)}\n\n"
-        )
+        ]
 
         total_components = 0
         for label, patterns in solution_components.items():
-            output += f"\n--- {label} ({len(patterns)} patterns) ---\n"
+            parts.append(f"\n--- {label} ({len(patterns)} patterns) ---\n")
             if not patterns:
-                output += "  No matching patterns found. Consider creating custom.\n"
+                parts.append("  No matching patterns found. Consider creating custom.\n")
                 continue
 
             for p in patterns:
                 total_components += 1
-                output += (
+                parts.append(
                     f"\n  [{p.id}] {p.name}\n"
                     f"      Object: {p.source_object} | Complexity: {p.complexity_score}/5\n"
                     f"      {(p.description or '')[:150]}\n"
                     f"      Fields: {', '.join(p.get_field_references()[:5])}\n"
                 )
 
-        output += (
+        parts.append(
             f"\n{'=' * 60}\n"
             f"Total Components: {total_components}\n\n"
             f"Next Steps:\n"
@@ -520,12 +649,12 @@ async def _compose_solution(args: dict) -> list[TextContent]:
             f"4. Deploy via SFDX or Metadata API\n"
         )
 
-        return [TextContent(type="text", text=output)]
+        return [TextContent(type="text", text="".join(parts))]
     finally:
         session.close()
 
 
-async def _generate_field_mapping(args: dict) -> list[TextContent]:
+def _generate_field_mapping(args: dict) -> list[TextContent]:
     """Generate field mapping template for a pattern."""
     pattern_id = args.get("pattern_id")
     target_object = args.get("target_object", "")
@@ -539,7 +668,7 @@ async def _generate_field_mapping(args: dict) -> list[TextContent]:
         fields = pattern.get_field_references()
         source_object = pattern.source_object
 
-        output = (
+        parts = [
             f"Field Mapping Template\n"
             f"{'=' * 60}\n"
             f"Pattern: {pattern.name} (#{pattern.id})\n"
@@ -547,7 +676,7 @@ async def _generate_field_mapping(args: dict) -> list[TextContent]:
             f"Target Object: {target_object}\n\n"
             f"Field Mappings (source → target):\n"
             f"{'-' * 40}\n"
-        )
+        ]
 
         mapping = {}
         for field in fields:
@@ -557,16 +686,16 @@ async def _generate_field_mapping(args: dict) -> list[TextContent]:
                 suggested = field
             elif "." in field:
                 # Related field - adjust object reference
-                parts = field.split(".")
-                suggested = f"{target_object}.{parts[-1]}" if len(parts) > 1 else field
+                segments = field.split(".")
+                suggested = f"{target_object}.{segments[-1]}" if len(segments) > 1 else field
             else:
                 # Standard field - keep as-is
                 suggested = field
 
             mapping[field] = suggested
-            output += f"  {field:40s} → {suggested}\n"
+            parts.append(f"  {field:40s} → {suggested}\n")
 
-        output += (
+        parts.append(
             f"\n{'-' * 40}\n"
             f"Total Fields: {len(fields)}\n\n"
             f"Instructions:\n"
@@ -577,39 +706,50 @@ async def _generate_field_mapping(args: dict) -> list[TextContent]:
         )
 
         # Include the structure for reference
-        output += f"\nPattern Structure (for reference):\n{json.dumps(pattern.get_structure(), indent=2)}\n"
+        parts.append(f"\nPattern Structure (for reference):\n{_dump_json(pattern.get_structure())}\n")
 
-        return [TextContent(type="text", text=output)]
+        return [TextContent(type="text", text="".join(parts))]
     finally:
         session.close()
 
 
+def _dump_json(obj) -> str:
+    """Pretty-print JSON with a two-space indent, with orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which json handles
+            pass
+    return json.dumps(obj, indent=2)
+
+
+# Words too common in requirements to be worth searching for
+_STOP_WORDS = frozenset({
+    "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "is", "are", "was", "were", "be", "been",
+    "being", "have", "has", "had", "do", "does", "did", "will", "would",
+    "could", "should", "may", "might", "shall", "can", "need", "must",
+    "that", "this", "these", "those", "i", "we", "you", "it", "they",
+    "me", "him", "her", "us", "them", "my", "your", "his", "its",
+    "our", "their", "what", "which", "who", "whom", "when", "where",
+    "why", "how", "all", "each", "every", "both", "few", "more",
+    "most", "other", "some", "such", "no", "not", "only", "same",
+    "so", "than", "too", "very", "just", "build", "create", "make",
+    "add", "implement", "setup", "configure",
+})
+
+# Words of two or more characters in lowercased text; punctuation and
+# hyphens separate words
+_WORD_RE = re.compile(r"[a-z][a-z0-9_]+")
+
+
 def _extract_keywords(text_input: str) -> list[str]:
     """Extract meaningful keywords from a requirement string."""
-    stop_words = {
-        "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for",
-        "of", "with", "by", "from", "is", "are", "was", "were", "be", "been",
-        "being", "have", "has", "had", "do", "does", "did", "will", "would",
-        "could", "should", "may", "might", "shall", "can", "need", "must",
-        "that", "this", "these", "those", "i", "we", "you", "it", "they",
-        "me", "him", "her", "us", "them", "my", "your", "his", "its",
-        "our", "their", "what", "which", "who", "whom", "when", "where",
-        "why", "how", "all", "each", "every", "both", "few", "more",
-        "most", "other", "some", "such", "no", "not", "only", "same",
-        "so", "than", "too", "very", "just", "build", "create", "make",
-        "add", "implement", "setup", "configure",
-    }
-
-    words = text_input.lower().split()
-    keywords = [w.strip(".,!?;:()") for w in words if w.strip(".,!?;:()") not in stop_words]
-    # Keep unique, preserve order
-    seen = set()
-    unique = []
-    for kw in keywords:
-        if kw and kw not in seen:
-            seen.add(kw)
-            unique.append(kw)
-    return unique[:10]
+    # findall() tokenizes in one C-level scan, yielding words already free
+    # of punctuation; keep unique ones in order
+    words = [w for w in _WORD_RE.findall(text_input.lower()) if w not in _STOP_WORDS]
+    return list(dict.fromkeys(words))[:10]
 
 
 # ── Entry Point ──
@@ -624,5 +764,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())